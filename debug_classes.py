@@ -1,25 +1,41 @@
-from ultralytics import YOLO
+import sys
 import cv2
+import numpy as np
+sys.path.append('src')
 
-# Load your custom model
-model = YOLO("models/weights/best.onnx", task="detect")
+from object_detection.inference.engine import load_model
+
+# Load your custom model (TensorRT engine on CUDA, ONNX otherwise)
+model = load_model("models/weights/best.onnx", task="detect")
 
 # Test on your video
 video_path = "/Users/at1293/Desktop/ObjectMapping-from-github/experiments/video_test/v01.mp4"
 cap = cv2.VideoCapture(video_path)
-ret, frame = cap.read()
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+# Decode into a preallocated buffer so repeated reads reuse the same memory
+height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+frame = np.empty((height, width, 3), np.uint8)
+ret = cap.grab()
+if ret:
+    ret, frame = cap.retrieve(frame)
 
 if ret:
     results = model(frame, conf=0.5)
     for r in results:
         if r.boxes is not None:
             print("Detections found:")
-            for box in r.boxes:
-                class_id = int(box.cls.item())
-                confidence = float(box.conf.item())
+            # One device->host transfer per attribute instead of per-box syncs
+            cls_list = r.boxes.cls.cpu().tolist()
+            conf_list = r.boxes.conf.cpu().tolist()
+            xyxy_list = r.boxes.xyxy.cpu().tolist()
+            for i in range(len(cls_list)):
+                class_id = int(cls_list[i])
+                confidence = conf_list[i]
                 print(f"  Class ID: {class_id}, Confidence: {confidence:.3f}")
                 
                 # Show bounding box info
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
+                x1, y1, x2, y2 = xyxy_list[i]
                 print(f"    BBox: ({x1:.0f}, {y1:.0f}) to ({x2:.0f}, {y2:.0f})")
 cap.release()
@@ -1,9 +1,13 @@
-from ultralytics import YOLO
+import sys
 import cv2
+import numpy as np
+sys.path.append('src')
 
-# Load your custom retrained model
+from object_detection.inference.engine import load_model
+
+# Load your custom retrained model (TensorRT engine on CUDA, ONNX otherwise)
 model_path = "models/weights/best.onnx"
-model = YOLO(model_path)
+model = load_model(model_path)
 
 # Check model info
 print("Custom model class names:", model.names)
@@ -12,11 +16,22 @@ print("Number of classes:", len(model.names))
 # Test on a frame
 video_path = "/Users/at1293/Desktop/ObjectMapping-from-github/experiments/video_test/v01.mp4"
 cap = cv2.VideoCapture(video_path)
-ret, frame = cap.read()
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+# Decode into a preallocated buffer so repeated reads reuse the same memory
+height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+frame = np.empty((height, width, 3), np.uint8)
+ret = cap.grab()
+if ret:
+    ret, frame = cap.retrieve(frame)
 if ret:
     results = model(frame, conf=0.7)
     for r in results:
         if r.boxes is not None:
-            for box in r.boxes:
-                print(f"Detected: Class {int(box.cls.item())}, Confidence: {float(box.conf.item()):.3f}")
+            # One device->host transfer per attribute instead of per-box syncs
+            cls_list = r.boxes.cls.cpu().tolist()
+            conf_list = r.boxes.conf.cpu().tolist()
+            for i in range(len(cls_list)):
+                print(f"Detected: Class {int(cls_list[i])}, Confidence: {conf_list[i]:.3f}")
 cap.release()
@@ -0,0 +1,86 @@
+"""TensorRT engine export and loading for YOLO weights."""
+
+import logging
+from pathlib import Path
+
+import torch
+from ultralytics import YOLO
+
+
+# One-time TensorRT export settings (FP16, dynamic shapes up to batch 8)
+ENGINE_EXPORT_ARGS = {
+    'format': 'engine',
+    'imgsz': 640,
+    'half': True,
+    'dynamic': True,
+    'batch': 8,
+    'workspace': 4,
+}
+
+
+def ensure_engine(weights_path: str) -> str:
+    """
+    Return the cached FP16 TensorRT engine for the given weights, exporting it on first use
+
+    The engine is exported once from the ``.pt`` checkpoint next to ``weights_path``
+    and cached beside it. Without CUDA (or without a checkpoint) the original
+    weights (e.g. ONNX) are returned unchanged.
+
+    Args:
+        weights_path: Path to the model weights (typically ``best.onnx``)
+
+    Returns:
+        str: Path to the engine, or ``weights_path`` as fallback
+    """
+    weights = Path(weights_path)
+    if not torch.cuda.is_available():
+        return weights_path
+
+    engine = weights.with_suffix('.engine')
+    if not engine.exists():
+        checkpoint = weights.with_suffix('.pt')
+        if not checkpoint.exists():
+            logging.warning(f"No checkpoint found at {checkpoint}, skipping TensorRT export")
+            return weights_path
+
+        logging.info(f"Exporting TensorRT engine from {checkpoint}")
+        YOLO(str(checkpoint)).export(**ENGINE_EXPORT_ARGS)
+
+    return str(engine)
+
+
+def load_model(weights_path: str, task: str = "detect") -> YOLO:
+    """Load YOLO weights, preferring a cached TensorRT engine when CUDA is available"""
+    return YOLO(ensure_engine(weights_path), task=task)
+
+
+def int8_weights_path(weights_path: str) -> Path:
+    """Path of the INT8 artifact for this device: TensorRT engine on CUDA, QDQ ONNX on CPU"""
+    weights = Path(weights_path)
+    suffix = '.engine' if torch.cuda.is_available() else '.onnx'
+    return weights.with_name(f"{weights.stem}_int8{suffix}")
+
+
+def resolve_weights(weights_path: str, precision: str = "fp32") -> str:
+    """
+    Pick the weights file matching the requested precision
+
+    Args:
+        weights_path: Path to the full-precision weights
+        precision: "fp32", "fp16" or "int8"
+
+    Returns:
+        str: Path to load, falling back to ``weights_path`` if no matching export exists
+    """
+    if precision == "fp32":
+        return weights_path
+    if precision == "fp16":
+        return ensure_engine(weights_path)
+    if precision != "int8":
+        raise ValueError(f"Unsupported precision: {precision}")
+
+    int8_path = int8_weights_path(weights_path)
+    if not int8_path.exists():
+        logging.warning(f"INT8 weights not found at {int8_path}, run src/scripts/export_int8.py. Using {weights_path}")
+        return weights_path
+    return str(int8_path)
@@ -1,20 +1,27 @@
 """Professional object detection predictor with configuration support."""
 
+import logging
 from pathlib import Path
 from typing import List, Union, Optional
 import cv2
 import numpy as np
+import torch
 from ultralytics import YOLO
+from ultralytics.utils import ops
 
 from ..utils.config import DetectionConfig, load_config
+from .engine import resolve_weights
 
 
 class ObjectDetector:
     """Professional object detection class with configuration support."""
     
-    def __init__(self, config_path: Optional[str] = None, model_path: Optional[str] = None):
-        """Initialize detector with config file or direct model path."""
-        if config_path:
+    def __init__(self, config_path: Optional[str] = None, model_path: Optional[str] = None,
+                 config: Optional[DetectionConfig] = None):
+        """Initialize detector with config file, direct model path, or a config object."""
+        if config is not None:
+            self.config = config
+        elif config_path:
             # Load from config file
             self.config = load_config(config_path)
         else:
@@ -23,17 +30,44 @@ class ObjectDetector:
             if model_path:
                 self.config.weights = model_path
         
-        self.model = YOLO(self.config.weights)
+        weights = resolve_weights(self.config.weights, self.config.precision)
+        self.model = YOLO(weights, task="detect")
+        
+        # FP16 engines take half-precision NCHW input; Ultralytics does the
+        # HWC->NCHW transpose and cast on device when half=True
+        self.half = self.config.precision == "fp16" and torch.cuda.is_available()
+        
+        # Optionally run in-memory frames on a resident engine instead of going
+        # through the Ultralytics wrapper: a replayed CUDA graph for TensorRT
+        # engines, or ONNX Runtime with IOBinding-bound device buffers
+        self.frame_engine = None
+        if self.config.cuda_graph and weights.endswith('.engine'):
+            from .cuda_graph import CudaGraphEngine
+            self.frame_engine = CudaGraphEngine(weights)
+        elif self.config.io_binding and weights.endswith('.onnx'):
+            import onnxruntime as ort
+            if 'CUDAExecutionProvider' in ort.get_available_providers():
+                from .ort_binding import IOBindingEngine
+                self.frame_engine = IOBindingEngine(weights)
+            else:
+                logging.warning("CUDAExecutionProvider unavailable (install onnxruntime-gpu), IOBinding disabled")
         
     def predict(self, source: Union[str, np.ndarray], save_results: Optional[bool] = None):
         """Detect objects using configuration settings."""
         # Use config setting or override
         should_save = save_results if save_results is not None else self.config.save_predictions
         
+        # Contiguous frames avoid an extra host-side copy during preprocessing
+        if isinstance(source, np.ndarray):
+            source = np.ascontiguousarray(source)
+            if self.frame_engine is not None and not should_save:
+                return [self._predict_frame(source)]
+        
         results = self.model.predict(
             source=source,
             conf=self.config.confidence_threshold,
             device=self.config.device,
+            half=self.half,
             save=should_save,
             project=self.config.output_dir
         )
@@ -48,14 +82,34 @@ class ObjectDetector:
             }
             
             if result.boxes is not None:
-                for box in result.boxes:
+                # One device->host transfer per attribute instead of per-box syncs
+                cls_list = result.boxes.cls.cpu().tolist()
+                conf_list = result.boxes.conf.cpu().tolist()
+                xywh_list = result.boxes.xywh.cpu().tolist()
+                for cls, conf, bbox in zip(cls_list, conf_list, xywh_list):
                     detection = {
-                        'class_name': result.names[int(box.cls[0])],
-                        'confidence': float(box.conf[0]),
-                        'bbox': box.xywh[0].tolist()
+                        'class_name': result.names[int(cls)],
+                        'confidence': conf,
+                        'bbox': bbox
                     }
                     image_detections['detections'].append(detection)
             
             all_detections.append(image_detections)
                     
         return all_detections
+    
+    def _predict_frame(self, frame: np.ndarray) -> dict:
+        """Detect objects in a single frame through the resident frame engine."""
+        det = self.frame_engine(frame, conf=self.config.confidence_threshold)
+        xywh = ops.xyxy2xywh(det[:, :4]).tolist()
+        
+        detections = [
+            {
+                'class_name': self.frame_engine.names[int(cls)],
+                'confidence': float(conf),
+                'bbox': bbox
+            }
+            for bbox, conf, cls in zip(xywh, det[:, 4].tolist(), det[:, 5].tolist())
+        ]
+        
+        return {'image_index': 0, 'image_path': 'image_0', 'detections': detections}
@@ -6,11 +6,26 @@ Computes perspective transformation matrix from ground truth points
 import numpy as np
 import cv2
 import json
-import matplotlib.pyplot as plt
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Union
 import logging
 
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, fastmath=True)
+def _project(H: np.ndarray, xy: np.ndarray) -> np.ndarray:
+    """Apply homography H to an (N, 2) point array, one row at a time"""
+    out = np.empty((xy.shape[0], 2), dtype=np.float64)
+    for i in range(xy.shape[0]):
+        x = xy[i, 0]
+        y = xy[i, 1]
+        w = H[2, 0] * x + H[2, 1] * y + H[2, 2]
+        out[i, 0] = (H[0, 0] * x + H[0, 1] * y + H[0, 2]) / w
+        out[i, 1] = (H[1, 0] * x + H[1, 1] * y + H[1, 2]) / w
+    return out
+
+
 class HomographyCalculator:
     """
     Calculates and validates homography transformation from image to real-world coordinates
@@ -24,9 +39,11 @@ class HomographyCalculator:
             ground_truth_file: Path to JSON file with point correspondences
         """
         self.homography_matrix = None
+        self._H = None  # Cached matrix for the pure NumPy transform path
         self.image_points = []
         self.world_points = []
-        self.reprojection_errors = []
+        self.reprojection_errors = np.empty(0)
+        self._transformed_points = None  # Reprojected image points, reused for plotting
         
         if ground_truth_file:
             self.load_ground_truth(ground_truth_file)
@@ -73,15 +90,25 @@ class HomographyCalculator:
             return False
         
         try:
-            # Calculate homography using RANSAC for robustness
-            self.homography_matrix, mask = cv2.findHomography(
-                self.image_points, 
-                self.world_points,
-                cv2.RANSAC,
-                ransacReprojThreshold=5.0
-            )
+            if len(self.image_points) == 4:
+                # Exactly determined: closed-form solution, nothing for RANSAC to reject
+                self.homography_matrix = cv2.getPerspectiveTransform(
+                    self.image_points,
+                    self.world_points
+                )
+            else:
+                # Calculate homography using RANSAC for robustness; fit quality
+                # is checked separately through the reprojection errors
+                self.homography_matrix, mask = cv2.findHomography(
+                    self.image_points, 
+                    self.world_points,
+                    cv2.RANSAC,
+                    ransacReprojThreshold=5.0,
+                    maxIters=200
+                )
             
             if self.homography_matrix is not None:
+                self._H = np.asarray(self.homography_matrix, dtype=np.float64)
                 self._calculate_reprojection_errors()
                 logging.info("Homography matrix calculated successfully")
                 return True
@@ -98,22 +125,19 @@ class HomographyCalculator:
         if self.homography_matrix is None:
             return
         
-        # Transform image points using calculated homography
-        transformed_points = cv2.perspectiveTransform(
-            self.image_points.reshape(-1, 1, 2),
-            self.homography_matrix
-        ).reshape(-1, 2)
+        # Same batch projection used at runtime, so validation measures that path
+        transformed_points = self.transform_points_batch(self.image_points)
         
         # Calculate Euclidean distances (errors)
-        self.reprojection_errors = [
-            np.linalg.norm(transformed - actual)
-            for transformed, actual in zip(transformed_points, self.world_points)
-        ]
+        self._transformed_points = transformed_points
+        self.reprojection_errors = np.linalg.norm(transformed_points - self.world_points, axis=1)
     
     def transform_point(self, pixel_x: float, pixel_y: float) -> Tuple[float, float]:
         """
         Transform a single pixel coordinate to real-world coordinates
         
+        For per-frame work use ``transform_points_batch``, which projects all points in one call.
+        
         Args:
             pixel_x: X coordinate in pixels
             pixel_y: Y coordinate in pixels
@@ -121,41 +145,39 @@ class HomographyCalculator:
         Returns:
             Tuple[float, float]: (x, y) in real-world coordinates
         """
-        if self.homography_matrix is None:
+        if self._H is None:
             raise ValueError("Homography matrix not calculated. Call calculate_homography() first.")
         
-        # Create point array for transformation
-        point = np.array([[[pixel_x, pixel_y]]], dtype=np.float32)
-        
-        # Transform using homography
-        transformed = cv2.perspectiveTransform(point, self.homography_matrix)
+        # Homogeneous matmul avoids OpenCV dispatch and temp arrays per point
+        x, y, w = self._H @ np.array([pixel_x, pixel_y, 1.0])
         
-        return float(transformed[0][0][0]), float(transformed[0][0][1])
+        return float(x / w), float(y / w)
     
-    def transform_points_batch(self, pixel_coordinates: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    def transform_points_batch(self, pixel_coordinates: Union[List[Tuple[float, float]], np.ndarray]) -> np.ndarray:
         """
         Transform multiple pixel coordinates to real-world coordinates
         
         Args:
-            pixel_coordinates: List of (x, y) pixel coordinates
+            pixel_coordinates: List or (N, 2) array of (x, y) pixel coordinates
             
         Returns:
-            List[Tuple[float, float]]: List of (x, y) real-world coordinates
+            np.ndarray: (N, 2) array of (x, y) real-world coordinates
         """
-        if self.homography_matrix is None:
+        if self._H is None:
             raise ValueError("Homography matrix not calculated. Call calculate_homography() first.")
         
-        if not pixel_coordinates:
-            return []
+        points = np.asarray(pixel_coordinates, dtype=np.float64).reshape(-1, 2)
+        if len(points) == 0:
+            return np.empty((0, 2), dtype=np.float64)
         
-        # Convert to numpy array
-        points = np.array(pixel_coordinates, dtype=np.float32).reshape(-1, 1, 2)
+        # JIT kernel projects row by row without Python dispatch
+        if NUMBA_AVAILABLE:
+            return _project(self._H, points)
         
-        # Transform using homography
-        transformed = cv2.perspectiveTransform(points, self.homography_matrix)
-        
-        # Convert back to list of tuples
-        return [(float(p[0][0]), float(p[0][1])) for p in transformed]
+        # Otherwise one matmul over (N, 3) homogeneous coordinates, then divide by w
+        homogeneous = np.hstack([points, np.ones((len(points), 1))])
+        projected = homogeneous @ self._H.T
+        return projected[:, :2] / projected[:, 2:]
     
     def validate_homography(self, max_error_threshold: float = 1.0) -> Dict:
         """
@@ -167,7 +189,7 @@ class HomographyCalculator:
         Returns:
             Dict: Validation results with statistics
         """
-        if not self.reprojection_errors:
+        if len(self.reprojection_errors) == 0:
             return {"valid": False, "error": "No reprojection errors calculated"}
         
         mean_error = np.mean(self.reprojection_errors)
@@ -193,15 +215,15 @@ class HomographyCalculator:
         Args:
             save_path: Optional path to save the plot
         """
-        if self.homography_matrix is None or not self.reprojection_errors:
+        if self.homography_matrix is None or len(self.reprojection_errors) == 0:
             logging.error("Cannot visualize: homography not calculated or no errors available")
             return
         
-        # Transform image points using calculated homography
-        transformed_points = cv2.perspectiveTransform(
-            self.image_points.reshape(-1, 1, 2),
-            self.homography_matrix
-        ).reshape(-1, 2)
+        # Imported here so tracking pipelines don't pay matplotlib's startup cost
+        import matplotlib.pyplot as plt
+        
+        # Reuse image points reprojected during error calculation
+        transformed_points = self._transformed_points
         
         # Create visualization
         plt.figure(figsize=(12, 8))
@@ -214,9 +236,8 @@ class HomographyCalculator:
         trans_x, trans_y = transformed_points[:, 0], transformed_points[:, 1]
         plt.scatter(trans_x, trans_y, c='red', label='Transformed Points', s=100, marker='x')
         
-        # Draw error lines
-        for i in range(len(self.world_points)):
-            plt.plot([actual_x[i], trans_x[i]], [actual_y[i], trans_y[i]], 'k--', alpha=0.5)
+        # Draw error lines: each column of the (2, N) arrays is one segment
+        plt.plot(np.vstack([actual_x, trans_x]), np.vstack([actual_y, trans_y]), 'k--', alpha=0.5)
         
         # Annotate errors
         for i, error in enumerate(self.reprojection_errors):
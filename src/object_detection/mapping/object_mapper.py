@@ -3,17 +3,155 @@ Object Mapper Module
 Combines object detection, tracking, and coordinate transformation for real-world mapping
 """
 
+import csv
 import cv2
+import functools
+import math
 import numpy as np
 import pandas as pd
+import queue
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Union
 import logging
+import torch
 from ultralytics import YOLO
+from ultralytics.utils.plotting import colors
 
+from ..inference.engine import ensure_engine
+from ..tracking.ultralytics_tracker import apply_tracking, create_tracker
+from ..utils.drawing import blit
 from .homography import HomographyCalculator
 
 
+# Frames waiting for display; older frames are dropped when the window falls behind
+DISPLAY_QUEUE_SIZE = 2
+
+# NVDEC decode pipeline for H.264 MP4 files, delivering BGR frames to OpenCV
+GSTREAMER_PIPELINE = (
+    "filesrc location={location} ! qtdemux ! h264parse ! nvh264dec ! "
+    "videoconvert ! video/x-raw,format=BGR ! appsink drop=false sync=false"
+)
+
+DECODERS = ("ultralytics", "ffmpeg", "gstreamer")
+
+BACKENDS = ("auto", "pt", "engine")
+
+# Column layout of object_mapping_results.csv
+CSV_FIELDS = ["frame", "track_id", "class_name", "confidence", "pixel_x", "pixel_y", "world_x", "world_y"]
+
+# Label sprite layout: first baseline offset from the sprite top, and total height
+LABEL_ASCENT = 14
+LABEL_HEIGHT = 50
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_sprite(id_text: str, world_text: str, pixel_text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize the three label lines once; repeated labels are then a masked copy
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: BGR sprite and its boolean text mask
+    """
+    width = max(
+        cv2.getTextSize(id_text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)[0][0],
+        cv2.getTextSize(world_text, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1)[0][0],
+        cv2.getTextSize(pixel_text, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1)[0][0]
+    ) + 2
+    
+    sprite = np.zeros((LABEL_HEIGHT, width, 3), dtype=np.uint8)
+    cv2.putText(sprite, id_text, (0, LABEL_ASCENT), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+    cv2.putText(sprite, world_text, (0, LABEL_ASCENT + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 0), 1)
+    cv2.putText(sprite, pixel_text, (0, LABEL_ASCENT + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 0, 255), 1)
+    
+    return sprite, sprite.any(axis=2)
+
+
+class TrackingBuffer:
+    """
+    Columnar (structure-of-arrays) store for per-detection tracking records
+    
+    Each column is a preallocated NumPy array that doubles in size when full,
+    so long streams avoid a Python dict per detection.
+    """
+    
+    COLUMNS = {
+        "frame": np.int32,
+        "track_id": np.int32,  # -1 when the tracker has not assigned an ID
+        "class_id": np.int32,
+        "confidence": np.float32,
+        "pixel_x": np.int32,
+        "pixel_y": np.int32,
+        "world_x": np.float32,
+        "world_y": np.float32
+    }
+    
+    def __init__(self, class_names: Dict[int, str], capacity: int = 4096):
+        self.class_names = class_names
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _reserve(self, count: int):
+        """Grow every column so that ``count`` more records fit"""
+        capacity = len(self._columns["frame"])
+        if self._size + count <= capacity:
+            return
+        
+        while capacity < self._size + count:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+    
+    def extend(self, frame: int, world_coords: List[Dict]):
+        """Append one frame's world-coordinate records"""
+        count = len(world_coords)
+        if count == 0:
+            return
+        
+        self._reserve(count)
+        start, end = self._size, self._size + count
+        columns = self._columns
+        columns["frame"][start:end] = frame
+        columns["track_id"][start:end] = [-1 if c["track_id"] is None else c["track_id"] for c in world_coords]
+        columns["class_id"][start:end] = [c["class_id"] for c in world_coords]
+        columns["confidence"][start:end] = [c["confidence"] for c in world_coords]
+        columns["pixel_x"][start:end] = [c["pixel_x"] for c in world_coords]
+        columns["pixel_y"][start:end] = [c["pixel_y"] for c in world_coords]
+        columns["world_x"][start:end] = [c["world_x"] for c in world_coords]
+        columns["world_y"][start:end] = [c["world_y"] for c in world_coords]
+        self._size = end
+    
+    def column(self, name: str) -> np.ndarray:
+        """View of the filled part of a column"""
+        return self._columns[name][:self._size]
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialize the records with the CSV column layout"""
+        track_id = pd.array(self.column("track_id"), dtype="Int32")
+        track_id[self.column("track_id") < 0] = pd.NA
+        
+        return pd.DataFrame({
+            "frame": self.column("frame"),
+            "track_id": track_id,
+            "class_name": pd.Series(self.column("class_id")).map(self.class_names),
+            "confidence": self.column("confidence"),
+            "pixel_x": self.column("pixel_x"),
+            "pixel_y": self.column("pixel_y"),
+            "world_x": self.column("world_x"),
+            "world_y": self.column("world_y")
+        })
+    
+    def to_records(self) -> List[Dict]:
+        """Records as dicts, with None for missing track IDs"""
+        df = self.to_dataframe().astype(object)
+        return df.where(df.notna(), None).to_dict("records")
+
+
 class ObjectMapper:
     """
     Complete pipeline for mapping detected objects from video to real-world coordinates
@@ -23,7 +161,9 @@ class ObjectMapper:
                  model_path: str,
                  homography_file: str,
                  class_names: Optional[Dict[int, str]] = None,
-                 confidence_threshold: float = 0.5):
+                 confidence_threshold: float = 0.5,
+                 backend: str = "auto",
+                 gpu_resize: bool = False):
         """
         Initialize object mapper with model and homography
         
@@ -32,8 +172,19 @@ class ObjectMapper:
             homography_file: Path to ground truth JSON for homography calculation
             class_names: Dictionary mapping class IDs to names
             confidence_threshold: Minimum confidence score for detections (default: 0.5)
+            backend: "auto" (FP16 TensorRT engine when a GPU is available, else the given
+                weights), "pt" (load the given weights as-is) or "engine" (require TensorRT)
+            gpu_resize: Downscale display frames with cv2.cuda when OpenCV is built with CUDA
         """
-        self.model = YOLO(model_path, task="detect")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}, expected one of {BACKENDS}")
+        
+        # The engine is exported once next to the weights and reused on later runs
+        weights = model_path if backend == "pt" else ensure_engine(model_path)
+        if backend == "engine" and not weights.endswith(".engine"):
+            raise ValueError(f"TensorRT engine unavailable for {model_path} (needs CUDA and a .pt checkpoint)")
+        
+        self.model = YOLO(weights, task="detect")
         self.homography_calc = HomographyCalculator(homography_file)
         
         # For your custom retrained model: person=0, car=1
@@ -45,7 +196,18 @@ class ObjectMapper:
             raise ValueError("Failed to calculate homography matrix")
         
         # Tracking data storage
-        self.tracking_data = []
+        self.tracking_data = TrackingBuffer(self.class_names)
+        self._reset_confidence_stats()
+        
+        # Persistent device buffers for display resizing, reused every frame
+        self._gpu_frame = None
+        self._gpu_resized = None
+        if gpu_resize:
+            if hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                self._gpu_frame = cv2.cuda_GpuMat()
+                self._gpu_resized = cv2.cuda_GpuMat()
+            else:
+                logging.warning("OpenCV was built without CUDA, resizing display frames on the CPU")
         
         logging.info(f"ObjectMapper initialized with confidence threshold: {confidence_threshold}")
         logging.info(f"Custom model classes: {self.class_names}")
@@ -54,55 +216,56 @@ class ObjectMapper:
         """
         Extract bottom center coordinates with track IDs and confidence filtering
         """
-        bottom_coordinates = []
-        if ids is None:
-            ids = [None] * len(boxes)
-        
-        for box, track_id in zip(boxes, ids):
-            # First check confidence
-            confidence = float(box.conf.item())
-            if confidence < self.confidence_threshold:
-                continue  # Skip low-confidence detections
-            
-            # Get class ID - should be 0 (person) or 1 (car) for your custom model
-            class_id = int(box.cls.item())
-            if class_id not in self.class_names:
-                logging.warning(f"Unknown class ID detected: {class_id}")
-                continue  # Skip unknown classes
-            
-            x_min, y_min, x_max, y_max = box.xyxy[0].tolist()
-            
-            # Calculate bottom center (where object touches ground)
-            bottom_center_x = int((x_min + x_max) / 2)
-            bottom_center_y = int(y_max)
-            
-            # Also keep left/right for visualization
-            bottom_left = (int(x_min), int(y_max))
-            bottom_right = (int(x_max), int(y_max))
-            
-            bottom_coordinates.append({
-                "track_id": int(track_id) if track_id is not None else None,
-                "bottom_center": (bottom_center_x, bottom_center_y),
-                "bottom_left": bottom_left,
-                "bottom_right": bottom_right,
+        # One device->host transfer per attribute instead of per-box .item() syncs
+        xyxy = boxes.xyxy.cpu().numpy()
+        conf = boxes.conf.cpu().numpy()
+        cls = boxes.cls.cpu().numpy().astype(np.int32)
+        track_ids = ids.cpu().numpy().astype(np.int64) if ids is not None else np.full(len(xyxy), -1)
+        
+        # Skip low-confidence detections and unknown classes
+        confident = conf >= self.confidence_threshold
+        known = np.isin(cls, list(self.class_names))
+        unknown_ids = np.unique(cls[confident & ~known])
+        if len(unknown_ids):
+            logging.warning(f"Unknown class IDs detected: {unknown_ids.tolist()}")
+        
+        mask = confident & known
+        xyxy, conf, cls, track_ids = xyxy[mask], conf[mask], cls[mask], track_ids[mask]
+        
+        # Bottom center is where the object touches the ground; left/right kept for visualization
+        box_ints = xyxy.astype(np.int32)
+        bottom_center_x = ((xyxy[:, 0] + xyxy[:, 2]) * 0.5).astype(np.int32)
+        
+        return [
+            {
+                "track_id": track_id if track_id >= 0 else None,
+                "bottom_center": (center_x, y_max),
+                "bottom_left": (x_min, y_max),
+                "bottom_right": (x_max, y_max),
                 "class_id": class_id,
                 "class_name": self.class_names[class_id],
                 "confidence": confidence,
-                "bbox": (int(x_min), int(y_min), int(x_max), int(y_max))
-            })
-        
-        return bottom_coordinates
+                "bbox": (x_min, y_min, x_max, y_max)
+            }
+            for (x_min, y_min, x_max, y_max), center_x, track_id, class_id, confidence in zip(
+                box_ints.tolist(), bottom_center_x.tolist(), track_ids.tolist(), cls.tolist(), conf.tolist()
+            )
+        ]
     
     def transform_to_world_coordinates(self, pixel_coordinates: List[Dict]) -> List[Dict]:
         """
         Transform pixel coordinates to real-world coordinates
         """
-        world_coordinates = []
+        if not pixel_coordinates:
+            return []
+        
+        # Project every bottom center through the homography in one batched call
+        pixels = np.array([coord_data["bottom_center"] for coord_data in pixel_coordinates], dtype=np.float64)
+        world_points = self.homography_calc.transform_points_batch(pixels).tolist()
         
-        for coord_data in pixel_coordinates:
-            # Transform bottom center point
+        world_coordinates = []
+        for coord_data, (world_x, world_y) in zip(pixel_coordinates, world_points):
             pixel_x, pixel_y = coord_data["bottom_center"]
-            world_x, world_y = self.homography_calc.transform_point(pixel_x, pixel_y)
             
             # Add world coordinates to the data
             enhanced_data = coord_data.copy()
@@ -122,39 +285,199 @@ class ObjectMapper:
                            output_dir: str = "outputs/mapping",
                            save_video: bool = True,
                            show_display: bool = True,
-                           tracker: str = "bytetrack.yaml") -> str:
+                           tracker: str = "bytetrack.yaml",
+                           decoder: str = "ultralytics",
+                           half: Optional[bool] = None,
+                           imgsz: int = 640,
+                           vid_stride: int = 1,
+                           retain_records: bool = True) -> str:
         """
         Process video stream with object detection, tracking, and coordinate mapping
+        
+        Args:
+            decoder: "ultralytics" (default CPU loader), "ffmpeg" (FFmpeg hardware
+                decode) or "gstreamer" (NVDEC pipeline, H.264 MP4 only)
+            half: FP16 inference; defaults to True when CUDA is available
+            imgsz: Inference size (the exported TensorRT engine is built for 640)
+            vid_stride: Process every n-th frame; recorded frame numbers stay in source frames
+            retain_records: Keep records in ``tracking_data`` for trajectories and summaries;
+                disable for constant memory on long streams (the CSV is streamed either way)
         """
+        if decoder not in DECODERS:
+            raise ValueError(f"Unsupported decoder: {decoder}, expected one of {DECODERS}")
+
         # Setup output directory
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Initialize tracking data storage
-        self.tracking_data = []
+        self.tracking_data = TrackingBuffer(self.class_names)
+        self._reset_confidence_stats()
         
         # Process video with tracking and confidence threshold
-        results = self.model.track(
-            source=video_source,
-            stream=True,
-            show=False,
-            tracker=tracker,
-            save=save_video,
-            save_dir=str(output_path),
-            conf=self.confidence_threshold  # Apply confidence threshold at YOLO level
-        )
-        
-        # Set up display if requested
-        if show_display:
-            cv2.namedWindow("Object Mapping", cv2.WINDOW_NORMAL)
-        
-        frame_count = 0
-        filtered_detections = 0
-        total_detections = 0
+        track_args = {
+            "tracker": tracker,
+            "conf": self.confidence_threshold,  # Apply confidence threshold at YOLO level
+            "half": torch.cuda.is_available() if half is None else half,
+            "imgsz": imgsz
+        }
+        if decoder == "ultralytics":
+            results = self.model.track(
+                source=video_source,
+                stream=True,
+                show=False,
+                save=save_video,
+                save_dir=str(output_path),
+                vid_stride=vid_stride,
+                **track_args
+            )
+        else:
+            cap = self._build_hw_capture(video_source, decoder)
+            results = self._track_capture(cap, track_args, output_path if save_video else None, vid_stride)
+        
+        # Records are streamed to the CSV by a writer thread as frames are processed
+        csv_path = output_path / f"object_mapping_results.csv"
+        csv_q = queue.Queue()
+        csv_thread = threading.Thread(target=self._write_csv, args=(csv_path, csv_q), daemon=True)
+        csv_thread.start()
+        
+        stats = {"frames": 0, "kept": 0, "total": 0}
+        stop_event = threading.Event()
+        
+        try:
+            if show_display:
+                # Inference runs on a worker thread; HighGUI must stay on the main thread
+                cv2.namedWindow("Object Mapping", cv2.WINDOW_NORMAL)
+                display_q = queue.Queue(maxsize=DISPLAY_QUEUE_SIZE)
+                worker = threading.Thread(
+                    target=self._track_results,
+                    args=(results, stats, stop_event, csv_q, retain_records, vid_stride, display_q),
+                    daemon=True
+                )
+                worker.start()
+                try:
+                    self._display_frames(display_q, stop_event)
+                finally:
+                    stop_event.set()
+                    worker.join()
+            else:
+                self._track_results(results, stats, stop_event, csv_q, retain_records, vid_stride)
+        
+        except KeyboardInterrupt:
+            logging.info("Processing interrupted by user")
+        
+        finally:
+            if show_display:
+                cv2.destroyAllWindows()
+            
+            # Flush remaining rows and close the CSV
+            csv_q.put(None)
+            csv_thread.join()
+        
+        if "error" in stats:
+            raise stats["error"]
+        
+        self._log_tracking_summary(csv_path, stats["kept"])
+        
+        logging.info(f"Processing complete. Results saved to {csv_path}")
+        logging.info(f"Final filtering: kept {stats['kept']}/{stats['total']} total detections")
+        
+        return str(csv_path)
+    
+    def _build_hw_capture(self, video_source: Union[str, int], decoder: str) -> cv2.VideoCapture:
+        """Open a video file with hardware-accelerated decoding"""
+        if not isinstance(video_source, str):
+            raise ValueError(f"Decoder '{decoder}' requires a video file path")
+        
+        if decoder == "gstreamer":
+            cap = cv2.VideoCapture(GSTREAMER_PIPELINE.format(location=video_source), cv2.CAP_GSTREAMER)
+        else:
+            # Falls back to software decode if no accelerator is present
+            cap = cv2.VideoCapture(
+                video_source,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+        
+        if not cap.isOpened():
+            raise ValueError(f"Could not open {video_source} with the {decoder} decoder")
+        return cap
+    
+    def _track_capture(self,
+                       cap: cv2.VideoCapture,
+                       track_args: Dict,
+                       save_dir: Optional[Path] = None,
+                       vid_stride: int = 1):
+        """
+        Track frames decoded by our own capture, yielding one result per frame
+        
+        Mirrors ``model.track(stream=True)`` for captures Ultralytics cannot open itself:
+        detection runs through ``model.predict`` and a standalone tracker, created fresh
+        for this capture, assigns IDs (``model.track`` on single frames would rebuild its
+        tracker on every call). Like Ultralytics' loader, ``vid_stride - 1`` frames are
+        skipped before every processed frame, so both decoders sample the same frames.
+        """
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30
+        writer = None
+        if save_dir is not None:
+            writer = cv2.VideoWriter(
+                str(save_dir / "tracked.mp4"),
+                cv2.VideoWriter_fourcc(*"mp4v"),
+                fps,
+                (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            )
+        
+        predict_args = {k: v for k, v in track_args.items() if k != "tracker"}
+        tracker = create_tracker(track_args["tracker"], fps / vid_stride)
         
+        try:
+            while True:
+                # Skipped frames are only demuxed, never decoded to BGR
+                for _ in range(vid_stride - 1):
+                    if not cap.grab():
+                        break
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                
+                result = self.model.predict(frame, verbose=False, **predict_args)[0]
+                result = apply_tracking(tracker, result)
+                
+                if writer is not None:
+                    writer.write(result.plot())
+                yield result
+        
+        finally:
+            cap.release()
+            if writer is not None:
+                writer.release()
+    
+    def _track_results(self,
+                       results,
+                       stats: Dict,
+                       stop_event: threading.Event,
+                       csv_q: queue.Queue,
+                       retain_records: bool = True,
+                       vid_stride: int = 1,
+                       display_q: Optional[queue.Queue] = None):
+        """
+        Consume tracker results: map detections to world coordinates and store them
+        
+        Args:
+            results: Streaming generator returned by ``model.track``
+            stats: Counters updated in place (frames, kept, total)
+            stop_event: Set by the display loop to stop early
+            csv_q: Queue receiving each frame's CSV rows
+            retain_records: Also append records to ``tracking_data``
+            vid_stride: Frame stride of ``results``, used to record source frame numbers
+            display_q: Queue receiving (result, world_coords) for display, or None
+        """
         try:
             for result in results:
-                frame_count += 1
+                if stop_event.is_set():
+                    break
+                
+                stats["frames"] += 1
                 boxes = result.boxes
                 ids = boxes.id if boxes is not None else None
                 
@@ -163,62 +486,80 @@ class ObjectMapper:
                     continue
                 
                 # Count total detections before filtering
-                total_detections += len(boxes)
+                stats["total"] += len(boxes)
                 
                 # Get bottom coordinates (with additional filtering)
                 pixel_coords = self.get_bottom_center_coordinates(boxes, ids)
-                filtered_detections += len(pixel_coords)
+                stats["kept"] += len(pixel_coords)
                 
                 # Transform to world coordinates
                 world_coords = self.transform_to_world_coordinates(pixel_coords)
                 
-                # Store tracking data
-                for coord_data in world_coords:
-                    self.tracking_data.append({
-                        "frame": frame_count,
-                        "track_id": coord_data["track_id"],
-                        "class_name": coord_data["class_name"],
-                        "confidence": coord_data["confidence"],
-                        "pixel_x": coord_data["pixel_x"],
-                        "pixel_y": coord_data["pixel_y"],
-                        "world_x": coord_data["world_x"],
-                        "world_y": coord_data["world_y"]
-                    })
+                # Store tracking data (1-based source frame number; result n is frame n * vid_stride)
+                source_frame = stats["frames"] * vid_stride
+                csv_q.put([
+                    (source_frame, "" if c["track_id"] is None else c["track_id"], c["class_name"], c["confidence"],
+                     c["pixel_x"], c["pixel_y"], c["world_x"], c["world_y"])
+                    for c in world_coords
+                ])
+                if retain_records:
+                    self.tracking_data.extend(source_frame, world_coords)
+                self._update_confidence_stats([c["confidence"] for c in world_coords])
                 
-                # Visualization
-                if show_display:
-                    frame = self._create_annotated_frame(result, world_coords)
-                    frame = self._resize_frame(frame, max_width=1280)
-                    
-                    cv2.imshow("Object Mapping", frame)
-                    if cv2.waitKey(1) & 0xFF == ord('q'):
-                        break
+                # Hand off to the display loop without waiting on it
+                if display_q is not None:
+                    self._put_latest(display_q, (result, world_coords))
                 
                 # Log progress periodically
-                if frame_count % 100 == 0:
-                    logging.info(f"Processed {frame_count} frames, kept {filtered_detections}/{total_detections} detections")
+                if stats["frames"] % 100 == 0:
+                    logging.info(f"Processed {stats['frames']} frames, kept {stats['kept']}/{stats['total']} detections")
         
-        except KeyboardInterrupt:
-            logging.info("Processing interrupted by user")
+        except Exception as e:
+            if display_q is None:
+                raise
+            stats["error"] = e
         
         finally:
-            if show_display:
-                cv2.destroyAllWindows()
-        
-        # Save results to CSV
-        csv_path = output_path / f"object_mapping_results.csv"
-        self._save_tracking_data(csv_path)
-        
-        logging.info(f"Processing complete. Results saved to {csv_path}")
-        logging.info(f"Final filtering: kept {len(self.tracking_data)}/{total_detections} total detections")
-        
-        return str(csv_path)
+            if display_q is not None:
+                self._put_latest(display_q, None)
+    
+    @staticmethod
+    def _put_latest(display_q: queue.Queue, item):
+        """Enqueue an item, dropping the oldest queued frame if the queue is full"""
+        try:
+            display_q.put_nowait(item)
+        except queue.Full:
+            try:
+                display_q.get_nowait()
+            except queue.Empty:
+                pass
+            display_q.put_nowait(item)
+    
+    def _display_frames(self, display_q: queue.Queue, stop_event: threading.Event):
+        """Annotate and show queued frames until the worker finishes or 'q' is pressed"""
+        while True:
+            item = display_q.get()
+            if item is None:
+                break
+            
+            result, world_coords = item
+            frame = self._create_annotated_frame(result, world_coords)
+            frame = self._resize_frame(frame, max_width=1280)
+            
+            cv2.imshow("Object Mapping", frame)
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                stop_event.set()
+                break
     
     def _create_annotated_frame(self, result, world_coords: List[Dict]) -> np.ndarray:
         """Create annotated frame with bounding boxes and world coordinates"""
-        frame = result.plot()  # Draw bounding boxes and IDs
+        # Draw on the source frame directly; Ultralytics has already saved its own output by now
+        frame = result.orig_img
         
         for coord_data in world_coords:
+            x_min, y_min, x_max, y_max = coord_data["bbox"]
+            cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), colors(coord_data["class_id"], True), 2)
+            
             if coord_data["track_id"] is not None:
                 # Draw bottom center point
                 center = coord_data["bottom_center"]
@@ -232,11 +573,10 @@ class ObjectMapper:
                 pixel_text = f"Pixel: ({coord_data['pixel_x']}, {coord_data['pixel_y']})"
                 id_text = f"ID: {coord_data['track_id']} ({coord_data['class_name']}) {coord_data['confidence']:.2f}"
                 
-                # Position text above the object
+                # Position text above the object (cached sprite, first baseline at text_y)
                 text_y = coord_data["bbox"][1] - 45
-                cv2.putText(frame, id_text, (center[0] - 50, text_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                cv2.putText(frame, world_text, (center[0] - 50, text_y + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 0), 1)
-                cv2.putText(frame, pixel_text, (center[0] - 50, text_y + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 0, 255), 1)
+                sprite, mask = _label_sprite(id_text, world_text, pixel_text)
+                blit(frame, sprite, mask, center[0] - 50, text_y - LABEL_ASCENT)
         
         return frame
     
@@ -247,44 +587,85 @@ class ObjectMapper:
             scale = max_width / width
             new_width = int(width * scale)
             new_height = int(height * scale)
-            frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
+            if self._gpu_frame is not None:
+                self._gpu_frame.upload(frame)
+                cv2.cuda.resize(self._gpu_frame, (new_width, new_height), self._gpu_resized,
+                                interpolation=cv2.INTER_AREA)
+                frame = self._gpu_resized.download()
+            else:
+                frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
         return frame
     
-    def _save_tracking_data(self, csv_path: Path):
-        """Save tracking data to CSV file"""
-        if self.tracking_data:
-            df = pd.DataFrame(self.tracking_data)
-            df.to_csv(csv_path, index=False)
-            logging.info(f"Saved {len(self.tracking_data)} tracking records to {csv_path}")
-            
-            # Log confidence statistics for verification
-            confidences = [record["confidence"] for record in self.tracking_data]
-            min_conf = min(confidences)
-            max_conf = max(confidences)
-            avg_conf = sum(confidences) / len(confidences)
+    def _reset_confidence_stats(self):
+        """Start new running confidence statistics"""
+        self._conf_min = math.inf
+        self._conf_max = -math.inf
+        self._conf_sum = 0.0
+        self._conf_n = 0
+        self._conf_below = 0
+    
+    def _update_confidence_stats(self, confidences: List[float]):
+        """Fold one frame's confidences into the running statistics"""
+        if not confidences:
+            return
+        self._conf_min = min(self._conf_min, min(confidences))
+        self._conf_max = max(self._conf_max, max(confidences))
+        self._conf_sum += sum(confidences)
+        self._conf_n += len(confidences)
+        self._conf_below += sum(c < self.confidence_threshold for c in confidences)
+    
+    @staticmethod
+    def _write_csv(csv_path: Path, csv_q: queue.Queue):
+        """Writer thread: append queued row chunks to the CSV until a None sentinel arrives"""
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            while True:
+                rows = csv_q.get()
+                if rows is None:
+                    break
+                writer.writerows(rows)
+    
+    def _log_tracking_summary(self, csv_path: Path, record_count: int):
+        """Log how many records were written and their confidence statistics"""
+        if record_count:
+            logging.info(f"Saved {record_count} tracking records to {csv_path}")
             
-            logging.info(f"Confidence stats - Min: {min_conf:.3f}, Max: {max_conf:.3f}, Avg: {avg_conf:.3f}")
+            # Log confidence statistics for verification (accumulated while processing)
+            avg_conf = self._conf_sum / self._conf_n
+            logging.info(f"Confidence stats - Min: {self._conf_min:.3f}, Max: {self._conf_max:.3f}, Avg: {avg_conf:.3f}")
             
             # Verify all are above threshold
-            below_threshold = [c for c in confidences if c < self.confidence_threshold]
-            if below_threshold:
-                logging.warning(f"Found {len(below_threshold)} detections below threshold!")
+            if self._conf_below:
+                logging.warning(f"Found {self._conf_below} detections below threshold!")
             else:
                 logging.info(f"✅ All detections above {self.confidence_threshold} threshold")
         else:
             logging.warning("No tracking data to save")
     
-    def get_object_trajectories(self) -> Dict[int, List[Tuple[float, float]]]:
+    def get_object_trajectories(self) -> Dict[int, np.ndarray]:
         """
         Extract complete trajectories for each tracked object in world coordinates
+        
+        Returns:
+            Dict[int, np.ndarray]: track ID -> (K, 2) array of (world_x, world_y) in frame order
         """
-        trajectories = {}
+        track_ids = self.tracking_data.column("track_id")
+        tracked = track_ids >= 0
+        track_ids = track_ids[tracked]
+        world = np.stack([self.tracking_data.column("world_x")[tracked],
+                          self.tracking_data.column("world_y")[tracked]], axis=1)
+        
+        # Stable sort groups records by track while keeping their frame order
+        order = np.argsort(track_ids, kind="stable")
+        track_ids, world = track_ids[order], world[order]
         
-        for record in self.tracking_data:
-            track_id = record["track_id"]
-            if track_id is not None:
-                if track_id not in trajectories:
-                    trajectories[track_id] = []
-                trajectories[track_id].append((record["world_x"], record["world_y"]))
+        # Group boundaries are where the sorted track ID changes
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(track_ids)) + 1))
+        ends = np.append(starts[1:], len(track_ids))
         
-        return trajectories
+        return {
+            int(track_ids[start]): world[start:end]
+            for start, end in zip(starts.tolist(), ends.tolist())
+            if end > start
+        }
@@ -2,6 +2,8 @@ import numpy as np
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
 @dataclass
 class Track:
     id: int
@@ -11,6 +13,42 @@ class Track:
     age: int = 0
     hits: int = 0
 
+@njit(cache=True, fastmath=True)
+def _iou_matrix(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """Pairwise IoU as a compiled double loop with scalar temporaries"""
+    n, m = boxes1.shape[0], boxes2.shape[0]
+    out = np.zeros((n, m), dtype=np.float32)
+    for i in range(n):
+        area1 = (boxes1[i, 2] - boxes1[i, 0]) * (boxes1[i, 3] - boxes1[i, 1])
+        for j in range(m):
+            w = min(boxes1[i, 2], boxes2[j, 2]) - max(boxes1[i, 0], boxes2[j, 0])
+            h = min(boxes1[i, 3], boxes2[j, 3]) - max(boxes1[i, 1], boxes2[j, 1])
+            if w <= 0 or h <= 0:
+                continue
+            intersection = w * h
+            area2 = (boxes2[j, 2] - boxes2[j, 0]) * (boxes2[j, 3] - boxes2[j, 1])
+            union = area1 + area2 - intersection
+            if union > 0:
+                out[i, j] = intersection / union
+    return out
+
+def iou_matrix(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between (N, 4) and (M, 4) boxes in [x1, y1, x2, y2] format, as an (N, M) array"""
+    if NUMBA_AVAILABLE:
+        return _iou_matrix(boxes1, boxes2)
+    
+    x1 = np.maximum(boxes1[:, None, 0], boxes2[None, :, 0])
+    y1 = np.maximum(boxes1[:, None, 1], boxes2[None, :, 1])
+    x2 = np.minimum(boxes1[:, None, 2], boxes2[None, :, 2])
+    y2 = np.minimum(boxes1[:, None, 3], boxes2[None, :, 3])
+    
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area1 = (boxes1[:, 2] - boxes1[:, 0]) * (boxes1[:, 3] - boxes1[:, 1])
+    area2 = (boxes2[:, 2] - boxes2[:, 0]) * (boxes2[:, 3] - boxes2[:, 1])
+    union = area1[:, None] + area2[None, :] - intersection
+    
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
 class SimpleTracker:
     """Simple IoU-based object tracker"""
     
@@ -46,20 +84,23 @@ class SimpleTracker:
         matched_tracks = {}
         unmatched_detections = []
         
-        for detection in detections:
-            det_bbox = detection['bbox']
-            best_match_id = None
-            best_iou = self.iou_threshold
-            
-            for track_id, track in self.tracks.items():
-                if track.class_name == detection['class_name']:
-                    iou = self.calculate_iou(det_bbox, track.bbox)
-                    if iou > best_iou:
-                        best_iou = iou
-                        best_match_id = track_id
-            
-            if best_match_id is not None:
-                self.tracks[best_match_id].bbox = det_bbox
+        # IoU of every detection against every track, zeroed across classes
+        track_ids = list(self.tracks)
+        if track_ids:
+            det_boxes = np.array([d['bbox'] for d in detections], dtype=np.float32)
+            track_boxes = np.array([self.tracks[t].bbox for t in track_ids], dtype=np.float32)
+            same_class = (np.array([d['class_name'] for d in detections])[:, None] ==
+                          np.array([self.tracks[t].class_name for t in track_ids])[None, :])
+            ious = np.where(same_class, iou_matrix(det_boxes, track_boxes), 0.0)
+            best_tracks = ious.argmax(axis=1).tolist()
+            best_ious = ious.max(axis=1).tolist()
+        else:
+            best_tracks = best_ious = [None] * len(detections)
+        
+        for detection, best_track, best_iou in zip(detections, best_tracks, best_ious):
+            if best_track is not None and best_iou > self.iou_threshold:
+                best_match_id = track_ids[best_track]
+                self.tracks[best_match_id].bbox = detection['bbox']
                 self.tracks[best_match_id].confidence = detection['confidence']
                 self.tracks[best_match_id].age = 0
                 self.tracks[best_match_id].hits += 1
@@ -0,0 +1,25 @@
+"""Standalone Ultralytics trackers for frames that are detected outside ``model.track``"""
+import torch
+from ultralytics.trackers.track import TRACKER_MAP
+from ultralytics.utils import IterableSimpleNamespace, yaml_load
+from ultralytics.utils.checks import check_yaml
+
+
+def create_tracker(tracker_cfg: str, frame_rate: float):
+    """Build a standalone ByteTrack/BoT-SORT instance from a tracker YAML"""
+    cfg = IterableSimpleNamespace(**yaml_load(check_yaml(tracker_cfg)))
+    return TRACKER_MAP[cfg.tracker_type](args=cfg, frame_rate=int(round(frame_rate)))
+
+
+def apply_tracking(tracker, result):
+    """Attach track IDs to a detection result, as ``model.track`` does internally"""
+    det = result.boxes.cpu().numpy()
+    if len(det) == 0:
+        return result
+    tracks = tracker.update(det, result.orig_img)
+    if len(tracks) == 0:
+        return result
+    idx = tracks[:, -1].astype(int)
+    result = result[idx]
+    result.update(boxes=torch.as_tensor(tracks[:, :-1]))
+    return result
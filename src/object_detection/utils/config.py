@@ -11,6 +11,9 @@ class DetectionConfig:
     weights: str = "models/weights/yolov8n.pt"
     confidence_threshold: float = 0.5
     device: str = "auto"
+    precision: str = "fp32"
+    cuda_graph: bool = False
+    io_binding: bool = False
     save_predictions: bool = True
     output_dir: str = "outputs/predictions"
 
@@ -27,6 +30,9 @@ def load_config(config_path: str) -> DetectionConfig:
         weights=model_config.get('weights', 'models/weights/yolov8n.pt'),
         confidence_threshold=model_config.get('confidence_threshold', 0.5),
         device=model_config.get('device', 'auto'),
+        precision=model_config.get('precision', 'fp32'),
+        cuda_graph=model_config.get('cuda_graph', False),
+        io_binding=model_config.get('io_binding', False),
         save_predictions=output_config.get('save_predictions', True),
         output_dir=output_config.get('output_dir', 'outputs/predictions')
     )
@@ -0,0 +1,19 @@
+"""Shared helpers for stamping pre-rendered sprites onto frames."""
+
+import numpy as np
+
+
+def blit(frame: np.ndarray, sprite: np.ndarray, mask: np.ndarray, x: int, y: int):
+    """Copy the masked sprite pixels onto the frame at (x, y), clipped to the frame"""
+    height, width = frame.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + sprite.shape[1], width), min(y + sprite.shape[0], height)
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    sx, sy = x0 - x, y0 - y
+    np.copyto(
+        frame[y0:y1, x0:x1],
+        sprite[sy:sy + y1 - y0, sx:sx + x1 - x0],
+        where=mask[sy:sy + y1 - y0, sx:sx + x1 - x0, None]
+    )
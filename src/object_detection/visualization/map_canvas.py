@@ -3,11 +3,125 @@
 Dynamic bounds based on ground truth annotations
 """
 
+import colorsys
 import cv2
+import functools
 import numpy as np
 import json
 from typing import Dict, List, Tuple, Optional
 
+from ..utils.drawing import blit
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
+# Grid spacing in meters
+GRID_SPACING = 5.0
+
+# Marker color per class; any other class uses DEFAULT_CLASS_COLOR
+CLASS_COLORS = {'person': (0, 255, 0)}
+DEFAULT_CLASS_COLOR = (255, 100, 0)
+
+# Positions kept per trail
+MAX_TRAIL_LENGTH = 50
+
+# Initial number of trail slots; the ring buffer doubles when they run out
+INITIAL_TRAIL_SLOTS = 64
+
+# Number of fade steps trails are drawn with (one polylines call each) without Numba
+TRAIL_BANDS = 8
+
+# Trail color at full brightness (BGR); older segments fade towards black
+TRAIL_COLOR = np.array([100, 150, 255], dtype=np.int32)
+
+def _build_fade_lut() -> np.ndarray:
+    """Pre-faded trail colors: entry [n, i] is segment i of an n-point trail (i < n)"""
+    lengths = np.arange(MAX_TRAIL_LENGTH + 1)
+    steps = np.minimum(lengths[None, :], lengths[:, None])  # clamp unused i >= n entries
+    return (TRAIL_COLOR * steps[:, :, None] // np.maximum(lengths, 1)[:, None, None]).astype(np.uint8)
+
+TRAIL_FADE_LUT = _build_fade_lut()
+
+# Pre-faded color of each band for the polylines fallback
+TRAIL_BAND_COLORS = [(TRAIL_COLOR * (band + 1) // TRAIL_BANDS).tolist() for band in range(TRAIL_BANDS)]
+
+def _build_band_lut() -> np.ndarray:
+    """Fallback fade bands: entry [n, i] is floor(i / n * TRAIL_BANDS) for segment i of an n-point trail"""
+    lengths = np.arange(MAX_TRAIL_LENGTH + 1)
+    return lengths[None, :] * TRAIL_BANDS // np.maximum(lengths, 1)[:, None]
+
+TRAIL_BAND_LUT = _build_band_lut()
+
+# Track colors: golden-ratio hue steps keep consecutive track IDs well apart
+TRACK_PALETTE_SIZE = 256
+TRACK_PALETTE = [
+    tuple(int(c * 255) for c in colorsys.hsv_to_rgb((i * 0.6180339887) % 1.0, 0.8, 0.9))
+    for i in range(TRACK_PALETTE_SIZE)
+]
+
+
+# Object marker sprite: filled dot inside a white ring, centered at MARKER_RADIUS
+MARKER_RADIUS = 10
+
+
+@functools.lru_cache(maxsize=None)
+def _marker_sprite(color: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasterize an object marker once per color; returns BGR sprite and boolean mask"""
+    size = 2 * MARKER_RADIUS + 1
+    center = (MARKER_RADIUS, MARKER_RADIUS)
+    sprite = np.zeros((size, size, 3), dtype=np.uint8)
+    mask = np.zeros((size, size), dtype=np.uint8)
+    for image, fill, ring in ((sprite, color, (255, 255, 255)), (mask, 255, 255)):
+        cv2.circle(image, center, 6, fill, -1)
+        cv2.circle(image, center, 8, ring, 2)
+    return sprite, mask.astype(bool)
+
+
+@functools.lru_cache(maxsize=1024)
+def _track_id_sprite(track_id: int) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Rasterize a track ID label once; returns sprite, mask and baseline row"""
+    text = str(track_id)
+    (width, ascent), descent = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+    sprite = np.zeros((ascent + descent + 2, width + 2, 3), dtype=np.uint8)
+    cv2.putText(sprite, text, (0, ascent), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    return sprite, sprite.any(axis=2), ascent
+
+@njit(cache=True, fastmath=True)
+def _render_trails(canvas: np.ndarray, points: np.ndarray, offsets: np.ndarray, fade_lut: np.ndarray):
+    """
+    Rasterize faded trails straight into the canvas with Bresenham lines (2 px thick)
+    
+    Trail t is ``points[offsets[t]:offsets[t + 1]]``; segment i of an n-point trail
+    is drawn in ``fade_lut[n, i]``.
+    """
+    height, width = canvas.shape[0], canvas.shape[1]
+    for t in range(offsets.shape[0] - 1):
+        start, end = offsets[t], offsets[t + 1]
+        n = end - start
+        for i in range(1, n):
+            b, g, r = fade_lut[n, i, 0], fade_lut[n, i, 1], fade_lut[n, i, 2]
+            
+            x, y = points[start + i - 1, 0], points[start + i - 1, 1]
+            x1, y1 = points[start + i, 0], points[start + i, 1]
+            dx, dy = abs(x1 - x), -abs(y1 - y)
+            sx = 1 if x < x1 else -1
+            sy = 1 if y < y1 else -1
+            err = dx + dy
+            while True:
+                for py in range(y, y + 2):
+                    for px in range(x, x + 2):
+                        if 0 <= px < width and 0 <= py < height:
+                            canvas[py, px, 0] = b
+                            canvas[py, px, 1] = g
+                            canvas[py, px, 2] = r
+                if x == x1 and y == y1:
+                    break
+                e2 = 2 * err
+                if e2 >= dy:
+                    err += dy
+                    x += sx
+                if e2 <= dx:
+                    err += dx
+                    y += sy
+
 class MapCanvas:
     """2D map visualization with dynamic world coordinate bounds"""
     
@@ -28,10 +142,63 @@ class MapCanvas:
             self.world_bounds = (-10.0, -10.0, 10.0, 10.0)
         
         self.objects = {}
-        self.trails = {}
+        
+        # Frame buffer reused by every render
+        self.canvas = np.empty((height, width, 3), dtype=np.uint8)
+        
+        # Trails as a structure-of-arrays ring buffer: one slot per track,
+        # positions[slot, i] written at head[slot] and wrapping after MAX_TRAIL_LENGTH
+        self._trail_pos = np.zeros((INITIAL_TRAIL_SLOTS, MAX_TRAIL_LENGTH, 2), dtype=np.int32)
+        self._trail_head = np.zeros(INITIAL_TRAIL_SLOTS, dtype=np.int32)
+        self._trail_len = np.zeros(INITIAL_TRAIL_SLOTS, dtype=np.int32)
+        self._trail_slots: Dict[int, int] = {}
+        self._free_slots = list(range(INITIAL_TRAIL_SLOTS - 1, -1, -1))
         
         print(f"Map bounds: X({self.world_bounds[0]:.1f}, {self.world_bounds[2]:.1f}) Y({self.world_bounds[1]:.1f}, {self.world_bounds[3]:.1f})")
     
+    @property
+    def world_bounds(self) -> Tuple[float, float, float, float]:
+        """World extent shown on the map as (x_min, y_min, x_max, y_max)"""
+        return self._world_bounds
+    
+    @world_bounds.setter
+    def world_bounds(self, bounds: Tuple[float, float, float, float]):
+        self._world_bounds = bounds
+        x_min, y_min, x_max, y_max = bounds
+        # Meters-to-pixels scale per axis
+        self._sx = self.width / (x_max - x_min)
+        self._sy = self.height / (y_max - y_min)
+        self._build_grid()
+        # Prerendered backgrounds depend on the bounds
+        self._backgrounds = {}
+    
+    def _build_grid(self):
+        """Precompute grid line positions for the current bounds"""
+        x_min, y_min, x_max, y_max = self.world_bounds
+        
+        # Integer multiples of the spacing inside the bounds (no float accumulation)
+        self._grid_x = np.arange(np.ceil(x_min / GRID_SPACING), np.floor(x_max / GRID_SPACING) + 1) * GRID_SPACING
+        self._grid_y = np.arange(np.ceil(y_min / GRID_SPACING), np.floor(y_max / GRID_SPACING) + 1) * GRID_SPACING
+        
+        # Pixel positions, matching world_to_pixel (Y axis flipped)
+        self._grid_x_px, _ = self.world_to_pixel_batch(self._grid_x, np.full(len(self._grid_x), y_min))
+        _, self._grid_y_px = self.world_to_pixel_batch(np.full(len(self._grid_y), x_min), self._grid_y)
+        
+        # Line endpoints as (G, 2, 2) int32 segment arrays for one polylines call per style
+        self._grid_x_segments = np.stack([
+            np.stack([self._grid_x_px, np.zeros_like(self._grid_x_px)], axis=1),
+            np.stack([self._grid_x_px, np.full_like(self._grid_x_px, self.height)], axis=1)
+        ], axis=1)
+        self._grid_y_segments = np.stack([
+            np.stack([np.zeros_like(self._grid_y_px), self._grid_y_px], axis=1),
+            np.stack([np.full_like(self._grid_y_px, self.width), self._grid_y_px], axis=1)
+        ], axis=1)
+        
+        self._grid_x_px = self._grid_x_px.tolist()
+        self._grid_y_px = self._grid_y_px.tolist()
+        self._grid_x_labels = [f"{int(x)}m" for x in self._grid_x]
+        self._grid_y_labels = [f"{int(y)}m" for y in self._grid_y]
+    
     def _calculate_bounds_from_gt(self, gt_file: str) -> Tuple[float, float, float, float]:
         """Calculate world bounds from ground truth file with buffer"""
         try:
@@ -58,15 +225,25 @@ class MapCanvas:
     
     def world_to_pixel(self, world_x: float, world_y: float) -> Tuple[int, int]:
         """Convert world coordinates to pixel coordinates"""
-        x_min, y_min, x_max, y_max = self.world_bounds
+        x_min, y_min, _, _ = self.world_bounds
         
-        # Normalize to [0, 1]
-        norm_x = (world_x - x_min) / (x_max - x_min)
-        norm_y = (world_y - y_min) / (y_max - y_min)
+        # Same arithmetic as world_to_pixel_batch so both agree exactly (flip Y axis)
+        pixel_x = int((world_x - x_min) * self._sx)
+        pixel_y = int(self.height - (world_y - y_min) * self._sy)  # Flip Y
+        
+        return pixel_x, pixel_y
+    
+    def world_to_pixel_batch(self, world_x: np.ndarray, world_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert arrays of world coordinates to pixel coordinates in one pass"""
+        x_min, y_min, _, _ = self.world_bounds
         
-        # Convert to pixel coordinates (flip Y axis)
-        pixel_x = int(norm_x * self.width)
-        pixel_y = int((1 - norm_y) * self.height)  # Flip Y
+        # One float temporary per axis, updated in place
+        pixel_x = np.subtract(world_x, x_min, dtype=np.float64)
+        pixel_x *= self._sx
+        pixel_y = np.subtract(world_y, y_min, dtype=np.float64)
+        pixel_y *= -self._sy
+        pixel_y += self.height  # Flip Y
+        pixel_x, pixel_y = pixel_x.astype(np.int32), pixel_y.astype(np.int32)
         
         return pixel_x, pixel_y
     
@@ -79,71 +256,165 @@ class MapCanvas:
             'pixel_pos': (pixel_x, pixel_y),
             'world_pos': (world_x, world_y),
             'class_name': class_name,
-            'confidence': confidence
+            'confidence': confidence,
+            'color': CLASS_COLORS.get(class_name, DEFAULT_CLASS_COLOR)
         }
         
-        # Update trail
-        if track_id not in self.trails:
-            self.trails[track_id] = []
+        # Update trail (ring buffer overwrites the oldest point)
+        self._append_trail(track_id, pixel_x, pixel_y)
+    
+    def update_objects(self, track_ids: List[int], world_x: np.ndarray, world_y: np.ndarray,
+                       class_names: List[str], confidences: List[float]):
+        """Update a frame's objects at once, converting all positions in one batch"""
+        pixel_x, pixel_y = self.world_to_pixel_batch(world_x, world_y)
         
-        self.trails[track_id].append((pixel_x, pixel_y))
+        for track_id, px, py, wx, wy, class_name, confidence in zip(
+                track_ids, pixel_x.tolist(), pixel_y.tolist(),
+                np.asarray(world_x).tolist(), np.asarray(world_y).tolist(), class_names, confidences):
+            self.objects[track_id] = {
+                'pixel_pos': (px, py),
+                'world_pos': (wx, wy),
+                'class_name': class_name,
+                'confidence': confidence,
+                'color': CLASS_COLORS.get(class_name, DEFAULT_CLASS_COLOR)
+            }
         
-        # Limit trail length
-        max_trail_length = 50
-        if len(self.trails[track_id]) > max_trail_length:
-            self.trails[track_id] = self.trails[track_id][-max_trail_length:]
+        # Scatter all positions into the ring buffers at once (track IDs are unique per frame)
+        slots = np.fromiter((self._trail_slot(track_id) for track_id in track_ids),
+                            dtype=np.intp, count=len(track_ids))
+        heads = self._trail_head[slots]
+        self._trail_pos[slots, heads, 0] = pixel_x
+        self._trail_pos[slots, heads, 1] = pixel_y
+        self._trail_head[slots] = (heads + 1) % MAX_TRAIL_LENGTH
+        self._trail_len[slots] = np.minimum(self._trail_len[slots] + 1, MAX_TRAIL_LENGTH)
+    
+    def _trail_slot(self, track_id: int) -> int:
+        """Ring-buffer slot of a track, claiming an empty one for new tracks"""
+        slot = self._trail_slots.get(track_id)
+        if slot is None:
+            if not self._free_slots:
+                self._grow_trail_slots()
+            slot = self._free_slots.pop()
+            self._trail_slots[track_id] = slot
+            self._trail_head[slot] = 0
+            self._trail_len[slot] = 0
+        return slot
+    
+    def _append_trail(self, track_id: int, pixel_x: int, pixel_y: int):
+        """Write a position at the track's ring-buffer head"""
+        slot = self._trail_slot(track_id)
+        head = self._trail_head[slot]
+        self._trail_pos[slot, head, 0] = pixel_x
+        self._trail_pos[slot, head, 1] = pixel_y
+        self._trail_head[slot] = (head + 1) % MAX_TRAIL_LENGTH
+        self._trail_len[slot] = min(self._trail_len[slot] + 1, MAX_TRAIL_LENGTH)
+    
+    def _grow_trail_slots(self):
+        """Double the number of trail slots"""
+        capacity = len(self._trail_head)
+        self._trail_pos = np.concatenate([self._trail_pos, np.zeros_like(self._trail_pos)])
+        self._trail_head = np.concatenate([self._trail_head, np.zeros_like(self._trail_head)])
+        self._trail_len = np.concatenate([self._trail_len, np.zeros_like(self._trail_len)])
+        self._free_slots.extend(range(2 * capacity - 1, capacity - 1, -1))
+    
+    def _ordered_trails(self) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        """
+        Gather all trails oldest-to-newest into one point array
+        
+        Returns:
+            Tuple[List[int], np.ndarray, np.ndarray]: track IDs, (P, 2) int32 points, and
+            (T + 1,) offsets so trail t is ``points[offsets[t]:offsets[t + 1]]``
+        """
+        track_ids = list(self._trail_slots)
+        slots = np.fromiter(self._trail_slots.values(), dtype=np.intp, count=len(track_ids))
+        heads, lengths = self._trail_head[slots], self._trail_len[slots]
+        
+        # Unroll each ring starting at its oldest entry, then keep the filled prefix
+        steps = np.arange(MAX_TRAIL_LENGTH)
+        index = (heads[:, None] - lengths[:, None] + steps[None, :]) % MAX_TRAIL_LENGTH
+        ordered = self._trail_pos[slots[:, None], index]
+        points = ordered[steps[None, :] < lengths[:, None]]
+        
+        offsets = np.zeros(len(track_ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return track_ids, points, offsets
+    
+    @property
+    def trails(self) -> Dict[int, np.ndarray]:
+        """Trail of each track as an (n, 2) array of pixel positions, oldest first"""
+        track_ids, points, offsets = self._ordered_trails()
+        return {track_id: points[offsets[i]:offsets[i + 1]] for i, track_id in enumerate(track_ids)}
+    
+    def remove_track(self, track_id: int):
+        """Drop a track's marker and free its trail slot"""
+        self.objects.pop(track_id, None)
+        slot = self._trail_slots.pop(track_id, None)
+        if slot is not None:
+            self._trail_len[slot] = 0
+            self._free_slots.append(slot)
     
-    def render(self, show_trails: bool = True, show_grid: bool = True) -> np.ndarray:
-        """Render the map with objects and trails"""
-        # Create blank canvas
-        canvas = np.full((self.height, self.width, 3), self.background_color, dtype=np.uint8)
+    def render(self, show_trails: bool = True, show_grid: bool = True, return_copy: bool = False) -> np.ndarray:
+        """
+        Render the map with objects and trails
         
-        # Draw grid
-        if show_grid:
-            self._draw_grid(canvas)
+        Returns a read-only view of the internal buffer, overwritten by the next render;
+        pass ``return_copy=True`` (or use ``render_into``) to keep the frame.
+        """
+        self.render_into(self.canvas, show_trails, show_grid)
+        
+        if return_copy:
+            return self.canvas.copy()
+        view = self.canvas.view()
+        view.setflags(write=False)
+        return view
+    
+    def render_into(self, out: np.ndarray, show_trails: bool = True, show_grid: bool = True):
+        """Render the map into a caller-provided (height, width, 3) uint8 buffer"""
+        # Start from the static background (fill, grid, labels)
+        np.copyto(out, self._get_background(show_grid))
         
         # Draw trails
         if show_trails:
-            self._draw_trails(canvas)
+            self._draw_trails(out)
         
         # Draw objects
-        self._draw_objects(canvas)
-        
-        # Draw coordinate labels
-        self._draw_coordinate_labels(canvas)
-        
-        return canvas
+        self._draw_objects(out)
+    
+    def _get_background(self, show_grid: bool) -> np.ndarray:
+        """Static map layers, rendered once per bounds and grid setting"""
+        background = self._backgrounds.get(show_grid)
+        if background is None:
+            background = np.full((self.height, self.width, 3), self.background_color, dtype=np.uint8)
+            
+            # Draw grid
+            if show_grid:
+                self._draw_grid(background)
+            
+            # Draw coordinate labels
+            self._draw_coordinate_labels(background)
+            
+            self._backgrounds[show_grid] = background
+        return background
     
     def _draw_grid(self, canvas: np.ndarray):
         """Draw coordinate grid with axis labels and tick marks"""
         x_min, y_min, x_max, y_max = self.world_bounds
         
-        # Grid spacing (every 5 meters)
-        grid_spacing = 5.0
-        
-        # Draw vertical grid lines with labels
-        x = x_min
-        while x <= x_max:
-            if x % grid_spacing == 0:
-                pixel_x, _ = self.world_to_pixel(x, y_min)
-                # Grid line
-                cv2.line(canvas, (pixel_x, 0), (pixel_x, self.height), (200, 200, 200), 1)
-                # X-axis label at bottom
-                cv2.putText(canvas, f"{int(x)}m", (pixel_x - 15, self.height - 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.4, (100, 100, 100), 1)
-            x += grid_spacing
-        
-        # Draw horizontal grid lines with labels  
-        y = y_min
-        while y <= y_max:
-            if y % grid_spacing == 0:
-                _, pixel_y = self.world_to_pixel(x_min, y)
-                # Grid line
-                cv2.line(canvas, (0, pixel_y), (self.width, pixel_y), (0, 0, 255), 3)
-                # Y-axis label at left
-                cv2.putText(canvas, f"{int(y)}m", (5, pixel_y + 5),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.4, (100, 100, 100), 1)
-            y += grid_spacing
+        # Draw all vertical and all horizontal grid lines, one call each
+        if len(self._grid_x_segments):
+            cv2.polylines(canvas, self._grid_x_segments, False, (200, 200, 200), 1)
+        if len(self._grid_y_segments):
+            cv2.polylines(canvas, self._grid_y_segments, False, (0, 0, 255), 3)
+        
+        # X-axis labels at bottom
+        for pixel_x, label in zip(self._grid_x_px, self._grid_x_labels):
+            cv2.putText(canvas, label, (pixel_x - 15, self.height - 5),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (100, 100, 100), 1)
+        
+        # Y-axis labels at left
+        for pixel_y, label in zip(self._grid_y_px, self._grid_y_labels):
+            cv2.putText(canvas, label, (5, pixel_y + 5),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (100, 100, 100), 1)
         
         # Draw origin axes (x=0, y=0) in darker color if they exist in bounds
         if x_min <= 0 <= x_max:
@@ -156,33 +427,44 @@ class MapCanvas:
 
     def _draw_trails(self, canvas: np.ndarray):
         """Draw object movement trails with fade effect"""
-        for track_id, trail in self.trails.items():
-            if len(trail) < 2:
-                continue
-            
-            for i in range(1, len(trail)):
-                # Fade effect: newer points are brighter
-                alpha = i / len(trail)
-                color = (int(100 * alpha), int(150 * alpha), int(255 * alpha))
-                
-                cv2.line(canvas, trail[i-1], trail[i], color, 2)
+        if not self._trail_slots:
+            return
+        
+        # All trails as one contiguous point array, read straight from the ring buffer
+        _, all_points, offsets = self._ordered_trails()
+        if NUMBA_AVAILABLE:
+            # Single compiled call for every trail
+            _render_trails(canvas, all_points, offsets, TRAIL_FADE_LUT)
+            return
+        
+        # Segment ending at point j of an n-point trail is segment i = local index of j
+        lengths = np.diff(offsets)
+        local = np.arange(len(all_points)) - np.repeat(offsets[:-1], lengths)
+        ends = np.flatnonzero(local >= 1)
+        if not len(ends):
+            return
+        segments = np.stack([all_points[ends - 1], all_points[ends]], axis=1)
+        
+        # Fade effect: newer segments are brighter; bands are looked up, not divided per segment
+        bands = TRAIL_BAND_LUT[np.repeat(lengths, lengths)[ends], local[ends]]
+        for band in range(TRAIL_BANDS):
+            band_segments = segments[bands == band]
+            if len(band_segments):
+                cv2.polylines(canvas, band_segments, False, TRAIL_BAND_COLORS[band], 2)
     
     def _draw_objects(self, canvas: np.ndarray):
         """Draw current object positions"""
         for track_id, obj in self.objects.items():
             pixel_x, pixel_y = obj['pixel_pos']
-            class_name = obj['class_name']
-            
-            # Color based on class
-            color = (0, 255, 0) if class_name == 'person' else (255, 100, 0)
             
-            # Draw circle
-            cv2.circle(canvas, (pixel_x, pixel_y), 6, color, -1)
-            cv2.circle(canvas, (pixel_x, pixel_y), 8, (255, 255, 255), 2)
+            # Marker and label are rasterized once and stamped as masked copies;
+            # color based on class (resolved once when the object is updated)
+            sprite, mask = _marker_sprite(obj['color'])
+            blit(canvas, sprite, mask, pixel_x - MARKER_RADIUS, pixel_y - MARKER_RADIUS)
             
             # Draw track ID
-            cv2.putText(canvas, str(track_id), (pixel_x + 10, pixel_y - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            sprite, mask, ascent = _track_id_sprite(track_id)
+            blit(canvas, sprite, mask, pixel_x + 10, pixel_y - 10 - ascent)
     
     def _draw_coordinate_labels(self, canvas: np.ndarray):
         """Draw coordinate system labels"""
@@ -196,19 +478,10 @@ class MapCanvas:
     
     def clear_trails(self):
         """Clear all movement trails"""
-        self.trails.clear()
+        self._trail_slots.clear()
+        self._trail_len[:] = 0
+        self._free_slots = list(range(len(self._trail_head) - 1, -1, -1))
     
     def get_track_color(self, track_id: int) -> Tuple[int, int, int]:
         """Get consistent color for a track ID"""
-        # Generate consistent colors based on track ID
-        colors = [
-            (0, 255, 0),    # Green
-            (255, 100, 0),  # Orange  
-            (255, 0, 255),  # Magenta
-            (0, 255, 255),  # Cyan
-            (255, 255, 0),  # Yellow
-            (255, 0, 0),    # Red
-            (0, 0, 255),    # Blue
-            (128, 255, 0),  # Lime
-        ]
-        return colors[track_id % len(colors)]
+        return TRACK_PALETTE[track_id & (TRACK_PALETTE_SIZE - 1)]
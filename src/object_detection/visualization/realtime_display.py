@@ -1,6 +1,9 @@
 import cv2
 import yaml
 import numpy as np
+import queue
+import threading
+import time
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import logging
@@ -11,6 +14,10 @@ from ..mapping.homography import HomographyCalculator
 from ..tracking.simple_tracker import SimpleTracker
 from ..tracking.simple_tracker import SimpleTracker
 from ..inference.predictor import ObjectDetector
+from ..utils.config import DetectionConfig
+
+# Frames buffered between pipeline stages
+PIPELINE_QUEUE_SIZE = 2
 
 class RealtimeDisplay:
     """Coordinates side-by-side video tracking and 2D map visualization"""
@@ -67,15 +74,28 @@ class RealtimeDisplay:
     
     def process_video_realtime(self, model_path: str, homography_file: str, 
                               confidence_threshold: float, video_source: str, device: str = "cpu", 
-                              show_fps: bool = True) -> bool:
-        """Process video with real-time side-by-side display"""
+                              show_fps: bool = True, pipeline: bool = False,
+                              io_binding: bool = False, precision: str = "fp32") -> bool:
+        """
+        Process video with real-time side-by-side display
+        
+        With ``pipeline`` enabled, decoding and detection run on their own threads so the
+        frame-to-frame time approaches the slowest stage instead of the sum of stages.
+        ``io_binding`` runs ONNX models through ONNX Runtime with bound CUDA buffers.
+        ``precision="int8"`` loads the quantized model written by ``export_int8.py``.
+        """
         # Setup display windows
         self.setup_windows()
         
         # Initialize components
-        detector = ObjectDetector(model_path=model_path)
-        detector.config.confidence_threshold = confidence_threshold
-        detector.config.device = device
+        detector = ObjectDetector(config=DetectionConfig(
+            weights=model_path,
+            confidence_threshold=confidence_threshold,
+            device=device,
+            precision=precision,
+            io_binding=io_binding,
+            save_predictions=False  # Per-frame image saving would also bypass the resident frame engines
+        ))
         # Validate and optimize device selection
         if "mps" in str(detector.config.device) and not torch.backends.mps.is_available():
             self.logger.warning("MPS not available, falling back to CPU")
@@ -104,6 +124,9 @@ class RealtimeDisplay:
             self.logger.error(f"Failed to open video source: {video_source}")
             return False
         
+        if pipeline:
+            return self._run_pipeline(cap, detector, homography_calc)
+        
         fps = cap.get(cv2.CAP_PROP_FPS) or 30
         frame_delay = int(1000 / fps)
         
@@ -130,6 +153,101 @@ class RealtimeDisplay:
         
         return True
     
+    def _run_pipeline(self, cap, detector, homography_calc) -> bool:
+        """Decoder and detector threads feed the main thread, which maps and displays"""
+        frame_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        det_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stop_event = threading.Event()
+        
+        workers = [
+            threading.Thread(target=self._read_frames, args=(cap, frame_q, stop_event), daemon=True),
+            threading.Thread(target=self._detect_frames, args=(detector, frame_q, det_q, stop_event), daemon=True)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        # Latency metrics: e2e = capture to display, f2f = display to display
+        e2e_total = f2f_total = 0.0
+        last_shown = None
+        shown = 0
+        
+        try:
+            while True:
+                item = det_q.get()
+                if item is None:
+                    break
+                
+                frame, detections, captured_at = item
+                self._update_displays(frame, detections, homography_calc)
+                
+                now = time.perf_counter()
+                e2e_total += now - captured_at
+                if last_shown is not None:
+                    f2f_total += now - last_shown
+                last_shown = now
+                shown += 1
+                
+                # Check for exit
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q') or key == 27:
+                    break
+        finally:
+            stop_event.set()
+            for worker in workers:
+                worker.join()
+            cap.release()
+            cv2.destroyAllWindows()
+        
+        if shown > 1:
+            f2f_avg = f2f_total / (shown - 1)
+            self.logger.info(f"Pipeline: {shown} frames, e2e {e2e_total / shown * 1000:.1f}ms, "
+                             f"f2f {f2f_avg * 1000:.1f}ms ({1 / f2f_avg:.1f} FPS)")
+        return True
+    
+    @staticmethod
+    def _put(q: queue.Queue, item, stop_event: threading.Event) -> bool:
+        """Blocking put that gives up once the pipeline is stopping"""
+        while not stop_event.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _read_frames(self, cap, frame_q: queue.Queue, stop_event: threading.Event):
+        """Decoder thread: push (frame, capture time) until the source ends"""
+        try:
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                if not self._put(frame_q, (frame, time.perf_counter()), stop_event):
+                    break
+        finally:
+            self._put(frame_q, None, stop_event)
+    
+    def _detect_frames(self, detector, frame_q: queue.Queue, det_q: queue.Queue, stop_event: threading.Event):
+        """Detector thread: run inference on decoded frames and pass detections on"""
+        try:
+            while not stop_event.is_set():
+                try:
+                    item = frame_q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    break
+                
+                frame, captured_at = item
+                results = detector.predict(frame)
+                detections = self._extract_detections(results, detector.model.names)
+                if not self._put(det_q, (frame, detections, captured_at), stop_event):
+                    break
+        except Exception as e:
+            self.logger.error(f"Detection thread failed: {e}", exc_info=True)
+        finally:
+            self._put(det_q, None, stop_event)
+    
     def _extract_detections(self, results, class_names):
         """Extract detection data from ObjectDetector results"""
         detections = []
@@ -158,9 +276,12 @@ class RealtimeDisplay:
     def _update_displays(self, frame, detections, homography_calc):
         """Update both video and map displays"""
         # Update map with detections
-        for det in detections:
-            world_x, world_y = homography_calc.transform_point(det['pixel_x'], det['pixel_y'])
-            self.map_canvas.update_object(det['track_id'], world_x, world_y, det['class_name'], det['confidence'])
+        if detections:
+            world = homography_calc.transform_points_batch([(det['pixel_x'], det['pixel_y']) for det in detections])
+            self.map_canvas.update_objects(
+                [det['track_id'] for det in detections], world[:, 0], world[:, 1],
+                [det['class_name'] for det in detections], [det['confidence'] for det in detections]
+            )
         
         # Render displays
         annotated_frame = self._annotate_frame(frame, detections)
@@ -1,7 +1,16 @@
-from ultralytics import YOLO
 import cv2
 import os
+import sys
+from pathlib import Path
+import torch
 os.environ['KMP_DUPLICATE_LIB_OK'] = 'TRUE'
 
-model = YOLO('D:\\Amir Taherkhani\\CosMos\\car_person\\Trial3\\runs\\detect\\train3\weights\\best.onnx')
-results__ = model.track(source = 'Videos\\V5.mp4', show = False, tracker = 'bytetrack.yaml', save = True, save_dir = 'v5_tracked')
\ No newline at end of file
+sys.path.append(str(Path(__file__).parent.parent))
+
+from object_detection.inference.engine import load_model
+
+use_cuda = torch.cuda.is_available()
+
+model = load_model('D:\\Amir Taherkhani\\CosMos\\car_person\\Trial3\\runs\\detect\\train3\\weights\\best.onnx')
+results__ = model.track(source = 'Videos\\V5.mp4', show = False, tracker = 'configs/tracker/bytetrack_fast.yaml', save = True, save_dir = 'v5_tracked',
+                        device = 0 if use_cuda else 'cpu', half = use_cuda)
@@ -1,10 +1,35 @@
+import argparse
+import csv
 import cv2
 import os
-import pandas as pd
-from ultralytics import YOLO
+import queue
+import sys
+import threading
+from pathlib import Path
+import torch
 
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
+sys.path.append(str(Path(__file__).parent.parent))
+
+from object_detection.inference.engine import ensure_engine, load_model
+from object_detection.tracking.ultralytics_tracker import apply_tracking, create_tracker
+
+BATCH_SIZE = 8  # Matches the dynamic batch size of the exported engine; other weights run batch 1
+QUEUE_SIZE = 8  # Bound on frames buffered between pipeline stages
+CSV_FLUSH_INTERVAL = 500  # Frames between CSV flushes
+DISPLAY_INTERVAL = 3  # Show every k-th frame on screen (all frames are still annotated and saved)
+CSV_FIELDS = [
+    "Frame",
+    "Track_ID",
+    "Class",
+    "Confidence",
+    "Bottom_Left_X",
+    "Bottom_Left_Y",
+    "Bottom_Right_X",
+    "Bottom_Right_Y",
+]
+
 def resize_frame(frame, max_width=1280):
     """Resize frame to fit screen while preserving aspect ratio."""
     height, width = frame.shape[:2]
@@ -12,129 +37,276 @@ def resize_frame(frame, max_width=1280):
         scale = max_width / width
         new_width = int(width * scale)
         new_height = int(height * scale)
-        frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
+        # INTER_LINEAR is SIMD-optimized and plenty for an on-screen preview
+        frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
     return frame
 
 def get_bottom_side_coordinates(boxes, ids):
     """Extract bottom side coordinates with track IDs."""
-    bottom_coordinates = []
+    # One device->host transfer per attribute instead of per-box .item() syncs
+    xyxy = boxes.xyxy.cpu().numpy().astype(int).tolist()
+    classes = boxes.cls.cpu().numpy().tolist()
+    confidences = boxes.conf.cpu().numpy().tolist()
     if ids is None:  # If no IDs (e.g., detection mode), skip IDs
-        ids = [None] * len(boxes)
-    for box, track_id in zip(boxes, ids):
-        x_min, y_min, x_max, y_max = box.xyxy[0].tolist()
-        bottom_left = (int(x_min), int(y_max))
-        bottom_right = (int(x_max), int(y_max))
-        bottom_coordinates.append({
-            "track_id": int(track_id) if track_id is not None else None,
-            "bottom_left": bottom_left,
-            "bottom_right": bottom_right,
-            "bottom_left_x": bottom_left[0],
-            "bottom_left_y": bottom_left[1],
-            "bottom_right_x": bottom_right[0],
-            "bottom_right_y": bottom_right[1],
-            "class": box.cls.item(),
-            "confidence": box.conf.item()
-        })
-    return bottom_coordinates
+        track_ids = [None] * len(xyxy)
+    else:
+        track_ids = ids.cpu().numpy().astype(int).tolist()
+    return [
+        {
+            "track_id": track_id,
+            "bottom_left": (x_min, y_max),
+            "bottom_right": (x_max, y_max),
+            "bottom_left_x": x_min,
+            "bottom_left_y": y_max,
+            "bottom_right_x": x_max,
+            "bottom_right_y": y_max,
+            "class": cls,
+            "confidence": conf
+        }
+        for (x_min, _, x_max, y_max), track_id, cls, conf in zip(xyxy, track_ids, classes, confidences)
+    ]
 
-def main():
-    # Load the model
-    model_path = "C:/AMIR/CosMos_Code/car_person/CODE/train/weights/best.onnx"
-    model = YOLO(model_path, task="detect")
+def read_frames(cap, read_q, stop_event):
+    """Reader thread: decode frames into read_q, then send a None sentinel."""
+    while not stop_event.is_set():
+        ret, frame = cap.read()
+        if not ret:
+            break
+        read_q.put(frame)
+    read_q.put(None)
 
-    # Video source
-    source = "C:/AMIR/CosMos_Code/car_person/CODE/Data/V1.mp4" 
-    save_dir = "V3"
-    os.makedirs(save_dir, exist_ok=True)
+def write_outputs(writer, write_q, csv_file):
+    """Writer thread: encode annotated frames and stream CSV rows until a None sentinel."""
+    csv_writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+    csv_writer.writeheader()
+    frames_written = 0
+    while True:
+        item = write_q.get()
+        if item is None:
+            break
+        frame, rows = item
+        if frame is not None:
+            writer.write(frame)
+        csv_writer.writerows(rows)
+        frames_written += 1
+        if frames_written % CSV_FLUSH_INTERVAL == 0:
+            csv_file.flush()
+
+def read_batches(read_q, batch_size=BATCH_SIZE):
+    """Yield lists of up to batch_size consecutive frames from the reader queue."""
+    frames = []
+    while True:
+        frame = read_q.get()
+        if frame is None:
+            break
+        frames.append(frame)
+        if len(frames) == batch_size:
+            yield frames
+            frames = []
+    if frames:
+        yield frames
+
+def track_video(model, read_q, tracker, device, half, batch_size=BATCH_SIZE):
+    """Run batched inference over queued frames, yielding tracked results frame by frame."""
+    for frames in read_batches(read_q, batch_size):
+        # A list source is inferred as a single batch
+        results = model.predict(frames, device=device, half=half, verbose=False)
+        # Tracker is stateful, so it must still see frames in order
+        for result in results:
+            yield apply_tracking(tracker, result)
+
+def annotate_frame(result, bottom_coords):
+    """Draw bounding boxes, track IDs and bottom coordinates on the frame."""
+    frame = result.plot()  # Draw bounding boxes and IDs
+    for coord in bottom_coords:
+        if coord["track_id"] is not None:
+            # Draw bottom line
+            cv2.line(
+                frame,
+                coord["bottom_left"],
+                coord["bottom_right"],
+                (0, 255, 0),
+                2,
+            )
+            # Draw track ID
+            cv2.putText(
+                frame,
+                f"ID {coord['track_id']}",
+                (coord["bottom_left"][0], coord["bottom_left"][1] - 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                (0, 255, 0),
+                2,
+            )
+            # Draw coordinates
+            coord_text = f"BL: ({coord['bottom_left_x']}, {coord['bottom_left_y']})"
+            cv2.putText(
+                frame,
+                coord_text,
+                (coord["bottom_left"][0], coord["bottom_left"][1] - 10),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5,
+                (0, 255, 0),
+                2,
+            )
+    return frame
 
-    # Initialize CSV data
-    csv_data = []
-
-    # Process video with tracking
-    results = model.track(
-        source=source,
-        stream=True,
-        show=False,
-        tracker="bytetrack.yaml",
-        save=True,
-        save_dir=save_dir,
+def process_video(model, source, save_dir, args, use_cuda, batch_size=BATCH_SIZE):
+    """Track one video with an already loaded model; returns False if the user quit."""
+    # Open video first so an unreadable source is skipped before any output is created
+    # FFmpeg backend with hardware decode (NVDEC/VAAPI/...) where available;
+    # falls back to software decode if no accelerator is present
+    cap = cv2.VideoCapture(
+        source,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
     )
+    if not cap.isOpened():
+        print(f"Could not open video {source}, skipping")
+        return True
+
+    os.makedirs(save_dir, exist_ok=True)
+
+    # CSV rows are streamed to disk as frames are processed
+    csv_path = os.path.join(save_dir, "bottom_coordinates.csv")
+    csv_file = open(csv_path, "w", newline="")
+
+    # Annotated output writer
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    writer = None
+    if args.display:
+        writer = cv2.VideoWriter(
+            os.path.join(save_dir, "tracked.mp4"),
+            cv2.VideoWriter_fourcc(*"mp4v"),
+            fps,
+            (width, height),
+        )
 
-    # Set up display window
-    cv2.namedWindow("Tracking with Bottom Coordinates", cv2.WINDOW_NORMAL)
+    # Decode and encode run on their own threads, overlapping with inference
+    read_q = queue.Queue(maxsize=QUEUE_SIZE)
+    write_q = queue.Queue(maxsize=QUEUE_SIZE)
+    stop_event = threading.Event()
+    reader_thread = threading.Thread(target=read_frames, args=(cap, read_q, stop_event), daemon=True)
+    writer_thread = threading.Thread(target=write_outputs, args=(writer, write_q, csv_file), daemon=True)
+    reader_thread.start()
+    writer_thread.start()
 
-    # Real-time processing
+    # Threads, capture, writer and CSV are released even if inference or tracking raises
     frame_count = 0
-    for result in results:
-        frame_count += 1
-        boxes = result.boxes
-        ids = boxes.id  # Track IDs
-
-        # Get bottom coordinates
-        bottom_coords = get_bottom_side_coordinates(boxes, ids)
-
-        # Collect data for CSV
-        for coord in bottom_coords:
-            track_id = coord["track_id"] if coord["track_id"] is not None else "N/A"
-            cls = "person" if coord["class"] == 0 else "car"  # Adjust based on your classes
-            csv_data.append({
-                "Frame": frame_count,
-                "Track_ID": track_id,
-                "Class": cls,
-                "Confidence": coord["confidence"],
-                "Bottom_Left_X": coord["bottom_left_x"],
-                "Bottom_Left_Y": coord["bottom_left_y"],
-                "Bottom_Right_X": coord["bottom_right_x"],
-                "Bottom_Right_Y": coord["bottom_right_y"]
-            })
-
-        # Visualize with track IDs and coordinates
-        frame = result.plot()  # Draw bounding boxes and IDs
-        for coord in bottom_coords:
-            if coord["track_id"] is not None:
-                # Draw bottom line
-                cv2.line(
-                    frame,
-                    coord["bottom_left"],
-                    coord["bottom_right"],
-                    (0, 255, 0),
-                    2,
-                )
-                # Draw track ID
-                cv2.putText(
-                    frame,
-                    f"ID {coord['track_id']}",
-                    (coord["bottom_left"][0], coord["bottom_left"][1] - 30),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (0, 255, 0),
-                    2,
-                )
-                # Draw coordinates
-                coord_text = f"BL: ({coord['bottom_left_x']}, {coord['bottom_left_y']})"
-                cv2.putText(
-                    frame,
-                    coord_text,
-                    (coord["bottom_left"][0], coord["bottom_left"][1] - 10),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (0, 255, 0),
-                    2,
-                )
-
-        # Resize frame for display
-        frame = resize_frame(frame, max_width=1280)
-
-        # Display frame
-        cv2.imshow("Tracking with Bottom Coordinates", frame)
-        if cv2.waitKey(1) & 0xFF == ord("q"):  # Press 'q' to quit
-            break
+    quit_requested = False
+    try:
+        # Process video with batched detection and tracking (fresh tracker per video)
+        tracker = create_tracker("configs/tracker/bytetrack_fast.yaml", frame_rate=fps)
+        results = track_video(
+            model,
+            read_q,
+            tracker,
+            device=0 if use_cuda else "cpu",
+            half=use_cuda,
+            batch_size=batch_size,
+        )
+
+        # Set up display window
+        if args.display:
+            cv2.namedWindow("Tracking with Bottom Coordinates", cv2.WINDOW_NORMAL)
+
+        # Real-time processing
+        for result in results:
+            frame_count += 1
+            boxes = result.boxes
+            ids = boxes.id  # Track IDs
+
+            # Get bottom coordinates
+            bottom_coords = get_bottom_side_coordinates(boxes, ids)
+
+            # Collect data for CSV
+            csv_rows = []
+            for coord in bottom_coords:
+                track_id = coord["track_id"] if coord["track_id"] is not None else "N/A"
+                cls = "person" if coord["class"] == 0 else "car"  # Adjust based on your classes
+                csv_rows.append({
+                    "Frame": frame_count,
+                    "Track_ID": track_id,
+                    "Class": cls,
+                    "Confidence": coord["confidence"],
+                    "Bottom_Left_X": coord["bottom_left_x"],
+                    "Bottom_Left_Y": coord["bottom_left_y"],
+                    "Bottom_Right_X": coord["bottom_right_x"],
+                    "Bottom_Right_Y": coord["bottom_right_y"]
+                })
+
+            # Headless runs skip all drawing and only write the CSV
+            if not args.display:
+                write_q.put((None, csv_rows))
+                continue
+
+            # Visualize with track IDs and coordinates; every frame goes to tracked.mp4,
+            # the display interval only throttles the preview window
+            frame = annotate_frame(result, bottom_coords)
+            write_q.put((frame, csv_rows))
+
+            if frame_count % args.display_interval == 0:
+                # Resize frame for display
+                frame = resize_frame(frame, max_width=1280)
 
-    # Save coordinates to CSV
-    csv_file = os.path.join(save_dir, "bottom_coordinates.csv")
-    pd.DataFrame(csv_data).to_csv(csv_file, index=False)
+                # Display frame (HighGUI must stay on the main thread)
+                cv2.imshow("Tracking with Bottom Coordinates", frame)
+                if cv2.waitKey(1) & 0xFF == ord("q"):  # Press 'q' to quit
+                    quit_requested = True
+                    break
+
+    finally:
+        # Stop the reader, drain its queue so it can exit, then flush the writer
+        stop_event.set()
+        while reader_thread.is_alive():
+            try:
+                read_q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        reader_thread.join()
+        if writer_thread.is_alive():
+            write_q.put(None)
+        writer_thread.join()
+
+        # Cleanup
+        cap.release()
+        if writer is not None:
+            writer.release()
+        csv_file.close()
+
+    return not quit_requested
+
+def main():
+    parser = argparse.ArgumentParser(description="Track objects and export bottom side coordinates")
+    parser.add_argument("--videos", nargs="+", default=["C:/AMIR/CosMos_Code/car_person/CODE/Data/V1.mp4"],
+                        help="One or more input videos, processed with a single model instance")
+    parser.add_argument("--model", default="C:/AMIR/CosMos_Code/car_person/CODE/train/weights/best.onnx",
+                        help="Path to model weights")
+    parser.add_argument("--save-dir", default="V3",
+                        help="Output directory (one subdirectory per video when several are given)")
+    parser.add_argument("--display", action=argparse.BooleanOptionalAction, default=True,
+                        help="Show and save annotated frames (--no-display writes only the CSV)")
+    parser.add_argument("--display-interval", type=int, default=DISPLAY_INTERVAL,
+                        help=f"Show every k-th frame in the preview window (default: {DISPLAY_INTERVAL}); "
+                             "every frame is still annotated and written to tracked.mp4")
+    args = parser.parse_args()
+
+    # Load the model once (TensorRT engine on CUDA, ONNX otherwise) and reuse it for every video
+    weights = ensure_engine(args.model)
+    model = load_model(weights, task="detect")
+    # Only the exported engine has a dynamic batch axis; ONNX/other weights may be fixed at batch 1
+    batch_size = BATCH_SIZE if weights.endswith(".engine") else 1
+    use_cuda = torch.cuda.is_available()
+
+    for source in args.videos:
+        save_dir = args.save_dir
+        if len(args.videos) > 1:
+            save_dir = os.path.join(args.save_dir, Path(source).stem)
+        if not process_video(model, source, save_dir, args, use_cuda, batch_size):
+            break
 
-    # Cleanup
     cv2.destroyAllWindows()
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+INT8 Model Export Script
+Produces a calibrated INT8 TensorRT engine (GPU) and a QDQ-quantized ONNX model (CPU)
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import torch
+from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+from ultralytics import YOLO
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from object_detection.inference.engine import int8_weights_path
+
+
+class ImageCalibrationReader(CalibrationDataReader):
+    """Feeds a small subset of images to ONNX Runtime static quantization"""
+
+    def __init__(self, image_dir: str, input_name: str, imgsz: int = 640, max_images: int = 100):
+        image_paths = sorted(
+            p for p in Path(image_dir).rglob("*") if p.suffix.lower() in (".jpg", ".jpeg", ".png")
+        )[:max_images]
+        if not image_paths:
+            raise ValueError(f"No calibration images found in {image_dir}")
+
+        self.input_name = input_name
+        self.imgsz = imgsz
+        self._paths = iter(image_paths)
+
+    def get_next(self):
+        path = next(self._paths, None)
+        if path is None:
+            return None
+
+        image = cv2.imread(str(path))
+        image = cv2.resize(image, (self.imgsz, self.imgsz))
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        tensor = image.transpose(2, 0, 1)[None].astype(np.float32) / 255.0
+        return {self.input_name: tensor}
+
+
+def export_engine(weights: Path, target: Path, data: str, imgsz: int):
+    """Export a calibrated INT8 TensorRT engine"""
+    exported = YOLO(str(weights)).export(format="engine", int8=True, data=data, imgsz=imgsz, workspace=4)
+    shutil.move(exported, target)
+
+
+def export_onnx(weights: Path, target: Path, calib_dir: str, imgsz: int, calib_size: int):
+    """Export ONNX, then statically quantize it to INT8 with QDQ nodes"""
+    exported = YOLO(str(weights)).export(format="onnx", imgsz=imgsz)
+
+    reader = ImageCalibrationReader(calib_dir, input_name="images", imgsz=imgsz, max_images=calib_size)
+    quantize_static(
+        exported,
+        str(target),
+        reader,
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export INT8 models for edge/CPU deployment")
+    parser.add_argument("--weights", default="models/weights/best.pt",
+                       help="Path to PyTorch checkpoint (default: models/weights/best.pt)")
+    parser.add_argument("--data", default="data.yaml",
+                       help="Dataset YAML used for TensorRT INT8 calibration")
+    parser.add_argument("--calib-dir",
+                       help="Directory of images used for ONNX Runtime calibration (CPU export)")
+    parser.add_argument("--calib-size", type=int, default=100,
+                       help="Number of calibration images (default: 100)")
+    parser.add_argument("--imgsz", type=int, default=640,
+                       help="Model input size (default: 640)")
+
+    args = parser.parse_args()
+
+    weights = Path(args.weights)
+    if not weights.exists():
+        print(f"❌ Checkpoint not found: {weights}")
+        return 1
+
+    # ObjectDetector loads this file when precision is "int8"
+    target = int8_weights_path(str(weights))
+
+    if torch.cuda.is_available():
+        print("🚀 Exporting INT8 TensorRT engine...")
+        export_engine(weights, target, args.data, args.imgsz)
+    else:
+        if not args.calib_dir:
+            print("❌ --calib-dir is required for CPU (ONNX) export")
+            return 1
+        print("🚀 Exporting INT8 ONNX model...")
+        export_onnx(weights, target, args.calib_dir, args.imgsz, args.calib_size)
+
+    print(f"✅ INT8 model saved to: {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,6 +50,12 @@ def main():
     # Performance arguments
     parser.add_argument("--device", default="cpu", choices=["cpu", "cuda", "mps"],
                        help="Device for inference (cpu, cuda, mps - default: cpu)")
+    parser.add_argument("--pipeline", action="store_true",
+                       help="Run decoding and detection on separate threads")
+    parser.add_argument("--io-binding", action="store_true",
+                       help="Run ONNX models via ONNX Runtime IOBinding on CUDA (needs onnxruntime-gpu)")
+    parser.add_argument("--int8", action="store_true",
+                       help="Load the INT8 model from src/scripts/export_int8.py (QDQ ONNX on CPU, TensorRT on CUDA)")
     parser.add_argument("--verbose", "-vv", action="store_true",
                        help="Enable verbose logging")
     
@@ -96,6 +102,7 @@ def main():
         logger.info(f"Model: {args.model}")
         logger.info(f"Homography: {args.gt}")
         logger.info(f"Confidence threshold: {args.confidence}")
+        logger.info(f"Precision: {'int8' if args.int8 else 'fp32'}")
         logger.info("="*60)
         logger.info("Controls:")
         logger.info("  'q' or ESC: Exit")
@@ -109,7 +116,10 @@ def main():
             confidence_threshold=args.confidence,
             video_source=video_source,
             device=args.device,
-            show_fps=not args.no_fps
+            show_fps=not args.no_fps,
+            pipeline=args.pipeline,
+            io_binding=args.io_binding,
+            precision="int8" if args.int8 else "fp32"
         )
         
         if success:
@@ -4,8 +4,8 @@ UI Launcher Script
 Starts the Streamlit point selection interface
 """
 
+import os
 import sys
-import subprocess
 from pathlib import Path
 
 def main():
@@ -20,9 +20,10 @@ def main():
     ]
     
     print("🚀 Starting Point Selection UI...")
-    print(f"📍 Access at: http://localhost:8501")
+    print(f"📍 Access at: http://localhost:8501", flush=True)
     
-    subprocess.run(cmd)
+    # Replace this process with Streamlit instead of idling as its parent
+    os.execvp(cmd[0], cmd)
 
 if __name__ == "__main__":
     main()
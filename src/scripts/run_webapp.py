@@ -3,13 +3,13 @@
 Launch the integrated Video-to-Map webapp
 """
 
-import subprocess
+import os
 import sys
 from pathlib import Path
 
 def main():
     # Get the webapp directory
-    webapp_dir = Path(__file__).parent.parent / "webapp"
+    webapp_dir = (Path(__file__).parent.parent / "webapp").resolve()
     main_file = webapp_dir / "main.py"
     
     if not main_file.exists():
@@ -26,13 +26,12 @@ def main():
     
     print("Starting Video-to-Map webapp...")
     print(f"Access at: http://localhost:8501")
-    print("Press Ctrl+C to stop")
+    print("Press Ctrl+C to stop", flush=True)
     
-    try:
-        subprocess.run(cmd, cwd=webapp_dir.parent.parent)
-    except KeyboardInterrupt:
-        print("\nWebapp stopped")
-        return 0
+    # Replace this process with Streamlit (same working directory as before)
+    # instead of keeping an idle parent interpreter around
+    os.chdir(webapp_dir.parent.parent)
+    os.execv(sys.executable, cmd)
 
 if __name__ == "__main__":
     sys.exit(main())
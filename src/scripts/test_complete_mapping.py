@@ -30,6 +30,12 @@ def main():
     parser.add_argument('--output', type=str, default='outputs/mapping', help='Output directory')
     parser.add_argument('--no-display', action='store_true', help='Disable real-time display')
     parser.add_argument('--no-save-video', action='store_true', help='Disable video saving')
+    parser.add_argument('--backend', choices=['auto', 'pt', 'engine'], default='auto',
+                       help='Model backend: TensorRT FP16 when a GPU is available, raw weights, or TensorRT only (default: auto)')
+    parser.add_argument('--imgsz', type=int, default=640, help='Inference image size (default: 640)')
+    parser.add_argument('--vid-stride', type=int, default=1, help='Process every n-th frame (default: 1)')
+    parser.add_argument('--decoder', choices=['ultralytics', 'ffmpeg', 'gstreamer'], default='ultralytics',
+                       help='Video decoder: Ultralytics CPU loader, FFmpeg hardware decode or GStreamer NVDEC (default: ultralytics)')
     
     args = parser.parse_args()
     
@@ -67,7 +73,8 @@ def main():
             model_path=args.model,
             homography_file=args.ground_truth,
             class_names=class_names,
-            confidence_threshold=args.confidence
+            confidence_threshold=args.confidence,
+            backend=args.backend
         )
         
         print(f"🎥 Processing video: {Path(args.video).name}")
@@ -80,17 +87,21 @@ def main():
             output_dir=args.output,
             save_video=not args.no_save_video,
             show_display=not args.no_display,
-            tracker="bytetrack.yaml"
+            tracker="bytetrack.yaml",
+            decoder=args.decoder,
+            imgsz=args.imgsz,
+            vid_stride=args.vid_stride
         )
         
         print(f"\n✅ Processing complete!")
         print(f"📊 Results saved to: {csv_path}")
         
         # Show summary statistics
-        if mapper.tracking_data:
-            total_detections = len(mapper.tracking_data)
-            unique_objects = len(set(record["track_id"] for record in mapper.tracking_data if record["track_id"] is not None))
-            frames_processed = max(record["frame"] for record in mapper.tracking_data)
+        if len(mapper.tracking_data):
+            df = mapper.tracking_data.to_dataframe()
+            total_detections = len(df)
+            unique_objects = df["track_id"].nunique()  # NA (untracked) is not counted
+            frames_processed = df["frame"].max()
             
             print(f"\n📈 Summary Statistics:")
             print(f"   Frames processed: {frames_processed}")
@@ -99,10 +110,7 @@ def main():
             print(f"   Confidence threshold: {args.confidence}")
             
             # Show class distribution
-            class_counts = {}
-            for record in mapper.tracking_data:
-                class_name = record["class_name"]
-                class_counts[class_name] = class_counts.get(class_name, 0) + 1
+            class_counts = df["class_name"].value_counts(sort=False)
             
             print(f"   Detection by class:")
             for class_name, count in class_counts.items():
@@ -114,8 +122,8 @@ def main():
             
             # Show sample world coordinates
             print(f"\n🌍 Sample World Coordinates:")
-            for i, record in enumerate(mapper.tracking_data[:5]):  # Show first 5
-                print(f"   Frame {record['frame']}: {record['class_name']} ID-{record['track_id']} → ({record['world_x']:.2f}, {record['world_y']:.2f})m")
+            for record in df.head(5).itertuples(index=False):  # Show first 5
+                print(f"   Frame {record.frame}: {record.class_name} ID-{record.track_id} → ({record.world_x:.2f}, {record.world_y:.2f})m")
         
         print(f"\n🎯 Next Steps:")
         print(f"   1. Check results CSV: {csv_path}")
@@ -10,38 +10,76 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from object_detection.inference.predictor import ObjectDetector
 
-def test_device_performance(model_path: str, test_frames: int = 10):
+# Frames per predict call for dynamic-batch engines; other weights run batch 1
+BATCH_SIZE = 8
+
+def _synchronize(device: str):
+    """Wait for queued device work so wall-clock timings are complete"""
+    if device == "cuda":
+        torch.cuda.synchronize()
+    elif device == "mps":
+        torch.mps.synchronize()
+
+def test_device_performance(model_path: str, test_frames: int = 64, batch_size: int = BATCH_SIZE):
     """Test inference speed on different devices"""
-    
+
     # Create dummy frame
     import numpy as np
     dummy_frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-    
+
     devices = ["cpu"]
+    if torch.cuda.is_available():
+        devices.append("cuda")
     if torch.backends.mps.is_available():
         devices.append("mps")
-    
+
+    # Only engines are exported with a dynamic batch axis; ONNX may be fixed at batch 1
+    if not model_path.endswith('.engine'):
+        batch_size = 1
+    num_batches = max(1, test_frames // batch_size)
+
     for device in devices:
         print(f"\nTesting {device.upper()}:")
-        
+
         # Initialize detector
         detector = ObjectDetector(model_path=model_path)
         detector.config.device = device
-        
+        detector.config.save_predictions = False  # Keep disk writes out of the timed loop
+
+        # One BCHW batch in [0, 1], uploaded once so the loop measures inference only
+        batch = torch.from_numpy(np.repeat(dummy_frame[None], batch_size, axis=0))
+        batch = batch.permute(0, 3, 1, 2).float().div(255)
+        if device == "cuda":
+            batch = batch.pin_memory().to(device, non_blocking=True)
+        elif device == "mps":
+            batch = batch.to(device)
+
         # Warmup
         for _ in range(3):
-            detector.predict(dummy_frame)
-        
+            detector.predict(batch)
+        _synchronize(device)
+
         # Time inference
-        start_time = time.time()
-        for i in range(test_frames):
-            results = detector.predict(dummy_frame)
-        end_time = time.time()
-        
-        avg_time = (end_time - start_time) / test_frames
+        if device == "cuda":
+            start_event = torch.cuda.Event(enable_timing=True)
+            end_event = torch.cuda.Event(enable_timing=True)
+            start_event.record()
+            for _ in range(num_batches):
+                results = detector.predict(batch)
+            end_event.record()
+            torch.cuda.synchronize()
+            elapsed = start_event.elapsed_time(end_event) / 1000
+        else:
+            start_time = time.perf_counter()
+            for _ in range(num_batches):
+                results = detector.predict(batch)
+            _synchronize(device)
+            elapsed = time.perf_counter() - start_time
+
+        avg_time = elapsed / (num_batches * batch_size)
         fps = 1.0 / avg_time
-        
-        print(f"  Average inference time: {avg_time*1000:.1f}ms")
+
+        print(f"  Average inference time: {avg_time*1000:.1f}ms per frame (batch {batch_size})")
         print(f"  Estimated FPS: {fps:.1f}")
 
 if __name__ == "__main__":
@@ -8,6 +8,8 @@ import sys
 from pathlib import Path
 import logging
 
+import numpy as np
+
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -54,9 +56,10 @@ def main():
         
         # Test single point transformation
         print(f"\n🧪 Testing point transformation:")
-        test_pixel = (400, 300)  # Example pixel coordinate
-        world_coord = calculator.transform_point(test_pixel[0], test_pixel[1])
-        print(f"   Pixel {test_pixel} → World ({world_coord[0]:.2f}, {world_coord[1]:.2f})")
+        test_pixels = np.array([[400, 300]], dtype=np.float32)  # Example pixel coordinates
+        world_coords = calculator.transform_points_batch(test_pixels)
+        for (px, py), (wx, wy) in zip(test_pixels.tolist(), world_coords.tolist()):
+            print(f"   Pixel ({px:.0f}, {py:.0f}) → World ({wx:.2f}, {wy:.2f})")
         
         # Create visualization
         print(f"\n📈 Creating accuracy visualization...")
@@ -36,17 +36,16 @@ def main():
         show_api_test_page()
 
 def show_home_page():
+    # Each card is one markdown element (heading + text) to keep the page's delta count low
     st.header("Complete Object Tracking Pipeline")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.subheader("🎯 Ground Truth Annotation")
-        st.write("Create reference points for perspective transformation. Upload surveillance video, select frame landmarks, input real-world coordinates, and export JSON for homography calculation.")
+        st.markdown("### 🎯 Ground Truth Annotation\n\nCreate reference points for perspective transformation. Upload surveillance video, select frame landmarks, input real-world coordinates, and export JSON for homography calculation.")
         
     with col2:
-        st.subheader("🗺️ Real-time Mapping")
-        st.write("Live video processing with coordinate mapping. Includes object detection and tracking, real-world coordinate transformation, side-by-side visualization, and CSV export with trajectories.")
+        st.markdown("### 🗺️ Real-time Mapping\n\nLive video processing with coordinate mapping. Includes object detection and tracking, real-world coordinate transformation, side-by-side visualization, and CSV export with trajectories.")
     
     st.write("---")
     st.subheader("System Capabilities")
@@ -70,16 +69,13 @@ def show_home_page():
     features_col1, features_col2, features_col3 = st.columns(3)
     
     with features_col1:
-        st.subheader("🔍 Detection & Tracking")
-        st.write("YOLO-based object detection with persistent ID assignment, GPU acceleration (MPS/CUDA), and configurable confidence thresholds.")
+        st.markdown("### 🔍 Detection & Tracking\n\nYOLO-based object detection with persistent ID assignment, GPU acceleration (MPS/CUDA), and configurable confidence thresholds.")
     
     with features_col2:
-        st.subheader("📐 Coordinate Mapping")
-        st.write("Homography transformation with pixel-to-meter conversion, error validation, and real-time processing capabilities.")
+        st.markdown("### 📐 Coordinate Mapping\n\nHomography transformation with pixel-to-meter conversion, error validation, and real-time processing capabilities.")
     
     with features_col3:
-        st.subheader("📊 Visualization")
-        st.write("Side-by-side display with object trails, fade effects, interactive map canvas, and built-in performance monitoring.")
+        st.markdown("### 📊 Visualization\n\nSide-by-side display with object trails, fade effects, interactive map canvas, and built-in performance monitoring.")
 
 def show_ground_truth_page():
     from pages.ground_truth import render_ground_truth_page
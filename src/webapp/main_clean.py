@@ -1,86 +0,0 @@
-import streamlit as st
-import sys
-import os
-
-# Add webapp directory to path for imports
-sys.path.append(os.path.dirname(__file__))
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
-def main():
-    st.set_page_config(
-        page_title="Video-to-Map Object Tracking System",
-        page_icon="🎯",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
-    
-    # NO STYLING IMPORTS OR CALLS AT ALL
-    st.title("Video-to-Map Object Tracking System")
-    st.write("Real-time surveillance footage analysis with coordinate mapping")
-    
-    # Sidebar navigation
-    st.sidebar.title("Navigation")
-    page = st.sidebar.selectbox(
-        "Choose a page:",
-        ["Home", "Ground Truth Annotation", "Real-time Mapping", "API Test"]
-    )
-    
-    if page == "Home":
-        show_home_page()
-    elif page == "Ground Truth Annotation":
-        show_ground_truth_page()
-    elif page == "Real-time Mapping":
-        show_realtime_mapping_page()
-    elif page == "API Test":
-        show_api_test_page()
-
-def show_home_page():
-    st.header("Complete Object Tracking Pipeline")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Ground Truth Annotation")
-        st.write("Create reference points for perspective transformation.")
-        
-    with col2:
-        st.subheader("Real-time Mapping")  
-        st.write("Live video processing with coordinate mapping.")
-    
-    st.write("---")
-    st.subheader("System Capabilities")
-    
-    # Simple metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("GPU Speedup", "4x")
-    with col2:
-        st.metric("Max FPS", "45+")
-    with col3:
-        st.metric("Track Consistency", "94%")
-    with col4:
-        st.metric("Total Latency", "<30ms")
-
-def show_ground_truth_page():
-    from pages.ground_truth import render_ground_truth_page
-    render_ground_truth_page()
-
-def show_realtime_mapping_page():
-    from pages.realtime_mapping import render_realtime_mapping_page
-    render_realtime_mapping_page()
-
-def show_api_test_page():
-    st.subheader("API Testing Interface")
-    st.write("Test the FastAPI detection endpoint.")
-    
-    uploaded_file = st.file_uploader("Upload an image", type=['jpg', 'jpeg', 'png'])
-    
-    if uploaded_file is not None:
-        st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
-        
-        if st.button("Run Detection"):
-            st.info("API integration coming soon.")
-
-if __name__ == "__main__":
-    main()
@@ -5,10 +5,11 @@ Integrates the existing point selector functionality
 
 import streamlit as st
 import cv2
+import hashlib
 import numpy as np
 from PIL import Image
 import json
-import pandas as pd
+from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import tempfile
@@ -19,6 +20,12 @@ import os
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
+# Height of the annotation canvas; frames are downsampled to it once when loaded
+CANVAS_HEIGHT = 400
+
+# Frames up to this far ahead of the open capture are reached by decoding forward, not seeking
+MAX_READ_AHEAD = 5
+
 def render_ground_truth_page():
     st.header("Ground Truth Point Selector")
     st.markdown("Select reference points with known real-world coordinates for perspective transformation")
@@ -43,10 +50,17 @@ def render_ground_truth_page():
         )
         
         if uploaded_video is not None:
-            # Save uploaded video temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-                tmp_file.write(uploaded_video.getvalue())
-                video_path = tmp_file.name
+            # Save uploaded video temporarily, once per upload rather than on every rerun
+            video_key = (uploaded_video.name, uploaded_video.size)
+            if st.session_state.get('video_key') != video_key:
+                video_bytes = uploaded_video.getvalue()
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
+                    tmp_file.write(video_bytes)
+                st.session_state.video_key = video_key
+                st.session_state.video_hash = hashlib.md5(video_bytes).hexdigest()
+                st.session_state.video_path = tmp_file.name
+            video_hash = st.session_state.video_hash
+            video_path = st.session_state.video_path
             
             st.success("Video uploaded successfully")
             
@@ -55,25 +69,72 @@ def render_ground_truth_page():
             
             # Load first frame to get total frames
             if st.session_state.current_frame is None:
-                frame_data = load_video_frame(video_path, 0)
+                frame_data = load_video_frame(video_hash, video_path, 0)
                 if frame_data[0] is not None:
-                    st.session_state.current_frame, total_frames = frame_data
+                    set_current_frame(frame_data[0])
+                    total_frames = frame_data[1]
             
-            frame_number = st.number_input(
-                "Frame number to annotate",
-                min_value=0,
-                max_value=total_frames-1 if 'total_frames' in locals() else 100,
-                value=0,
-                help="Select which frame to use for point annotation"
-            )
+            # Form: editing the frame number doesn't rerun the page until "Load Frame"
+            with st.form("frame_select_form"):
+                frame_number = st.number_input(
+                    "Frame number to annotate",
+                    min_value=0,
+                    max_value=total_frames-1 if 'total_frames' in locals() else 100,
+                    value=0,
+                    help="Select which frame to use for point annotation"
+                )
+                load_frame = st.form_submit_button("Load Frame")
             
             # Load selected frame
-            if st.button("Load Frame"):
-                frame_data = load_video_frame(video_path, frame_number)
+            if load_frame:
+                frame_data = load_video_frame(video_hash, video_path, frame_number)
                 if frame_data[0] is not None:
-                    st.session_state.current_frame = frame_data[0]
-                    st.rerun()
+                    set_current_frame(frame_data[0])
+    
+    # The canvas is drawn and synced before the point widgets below, so a click updates
+    # selected_points within the same run instead of forcing a full rerun
+    with col1:
+        if st.session_state.current_frame is not None:
+            st.subheader("Click to Select Points")
+            st.write("Click on recognizable landmarks whose real-world coordinates you know")
+            
+            # Create canvas for point selection
+            canvas_result = st_canvas(
+                fill_color="rgba(255, 0, 0, 0.3)",
+                stroke_width=3,
+                stroke_color="#FF0000",
+                background_color="#FFFFFF",
+                background_image=st.session_state.current_frame_display,
+                update_streamlit=True,
+                height=CANVAS_HEIGHT,
+                width=st.session_state.current_frame_display.width,
+                drawing_mode="point",
+                point_display_radius=8,
+                key="canvas",
+            )
             
+            # Process canvas clicks
+            if canvas_result.json_data is not None:
+                objects = canvas_result.json_data["objects"]
+                scale = st.session_state.display_scale
+                
+                # Circle centers, from canvas coordinates back to full-resolution frame pixels
+                current_points = [
+                    [(obj["left"] + obj["radius"]) / scale, (obj["top"] + obj["radius"]) / scale]
+                    for obj in objects if obj["type"] == "circle"
+                ]
+                
+                # Update session state only if the points actually changed
+                if current_points != st.session_state.selected_points:
+                    st.session_state.selected_points = current_points
+                    # Truncate real_world_coords if we have fewer points now
+                    if len(current_points) < len(st.session_state.real_world_coords):
+                        st.session_state.real_world_coords = st.session_state.real_world_coords[:len(current_points)]
+        else:
+            st.info("Upload a video file to start selecting points")
+    
+    with col2:
+        if uploaded_video is not None:
             # Point management
             st.subheader("Point Management")
             st.info(f"Selected Points: {len(st.session_state.selected_points)}")
@@ -114,84 +175,86 @@ def render_ground_truth_page():
             if len(st.session_state.selected_points) >= 4 and len(st.session_state.selected_points) == len(st.session_state.real_world_coords):
                 st.subheader("Save Ground Truth")
                 
-                save_name = st.text_input("File name", value=f"{uploaded_video.name}_ground_truth.json")
+                with st.form("save_form"):
+                    save_name = st.text_input("File name", value=f"{uploaded_video.name}_ground_truth.json")
+                    save_points = st.form_submit_button("Save Points")
                 
-                if st.button("Save Points"):
+                if save_points:
                     output_path = f"outputs/ground_truth/{save_name}"
                     save_ground_truth_points(output_path, uploaded_video.name, frame_number)
     
+    # Summary goes below the canvas, after the col2 widgets have applied their updates
     with col1:
-        if st.session_state.current_frame is not None:
-            st.subheader("Click to Select Points")
-            st.write("Click on recognizable landmarks whose real-world coordinates you know")
-            
-            # Create canvas for point selection
-            canvas_result = st_canvas(
-                fill_color="rgba(255, 0, 0, 0.3)",
-                stroke_width=3,
-                stroke_color="#FF0000",
-                background_color="#FFFFFF",
-                background_image=Image.fromarray(st.session_state.current_frame),
-                update_streamlit=True,
-                height=400,
-                drawing_mode="point",
-                point_display_radius=8,
-                key="canvas",
-            )
-            
-            # Process canvas clicks
-            if canvas_result.json_data is not None:
-                objects = canvas_result.json_data["objects"]
-                current_points = []
-                
-                for obj in objects:
-                    if obj["type"] == "circle":
-                        x = obj["left"] + obj["radius"]
-                        y = obj["top"] + obj["radius"]
-                        current_points.append([x, y])
-                
-                # Update session state if points changed
-                if len(current_points) != len(st.session_state.selected_points):
-                    st.session_state.selected_points = current_points
-                    # Truncate real_world_coords if we have fewer points now
-                    if len(current_points) < len(st.session_state.real_world_coords):
-                        st.session_state.real_world_coords = st.session_state.real_world_coords[:len(current_points)]
-                    st.rerun()
+        if st.session_state.current_frame is not None and st.session_state.selected_points:
+            st.subheader("Selected Points Summary")
+            world_coords = st.session_state.real_world_coords
             
-            # Display current points
-            if st.session_state.selected_points:
-                st.subheader("Selected Points Summary")
-                for i, (img_point, world_coord) in enumerate(zip(
-                    st.session_state.selected_points, 
-                    st.session_state.real_world_coords + [None] * len(st.session_state.selected_points)
-                )):
-                    if world_coord:
-                        st.write(f"**Point {i+1}**: ({img_point[0]:.1f}, {img_point[1]:.1f}) → ({world_coord['x']:.2f}m, {world_coord['y']:.2f}m) - {world_coord['description']}")
-                    else:
-                        st.write(f"**Point {i+1}**: ({img_point[0]:.1f}, {img_point[1]:.1f}) → ⏳ Awaiting coordinates")
-        else:
-            st.info("Upload a video file to start selecting points")
+            # One markdown element for the whole list instead of one per point
+            lines = []
+            for i, img_point in enumerate(st.session_state.selected_points):
+                if i < len(world_coords):
+                    world_coord = world_coords[i]
+                    target = f"({world_coord['x']:.2f}m, {world_coord['y']:.2f}m) - {world_coord['description']}"
+                else:
+                    target = "⏳ Awaiting coordinates"
+                lines.append(f"**Point {i+1}**: ({img_point[0]:.1f}, {img_point[1]:.1f}) → {target}")
+            st.markdown("\n\n".join(lines))
+
+def set_current_frame(frame: np.ndarray):
+    """Make a frame current, keeping a canvas-sized copy so full resolution never reaches the browser"""
+    scale = CANVAS_HEIGHT / frame.shape[0]
+    display = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
+    st.session_state.current_frame = frame
+    st.session_state.current_frame_display = Image.fromarray(display)
+    st.session_state.display_scale = display.shape[0] / frame.shape[0]
+
+def _video_capture(video_path: str) -> cv2.VideoCapture:
+    """FFmpeg capture kept open across reruns for the current video"""
+    if st.session_state.get('_cap_path') != video_path:
+        if st.session_state.get('_cap') is not None:
+            st.session_state._cap.release()
+        st.session_state._cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+        st.session_state._cap_path = video_path
+    return st.session_state._cap
 
-def load_video_frame(video_path: str, frame_number: int = 0):
+def _read_video_frame(cap: cv2.VideoCapture, frame_number: int):
+    """Decode one frame as RGB from the persistent capture"""
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if frame_number >= total_frames:
+        frame_number = 0
+    
+    # Nearby later frames: grab forward from the capture's reported position instead
+    # of seeking back to a keyframe and decoding up to the target again
+    skip = frame_number - int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+    if 0 <= skip <= MAX_READ_AHEAD:
+        for _ in range(skip):
+            cap.grab()
+    else:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    ret, frame = cap.read()
+    
+    if not ret:
+        raise ValueError(f"Could not read frame {frame_number} from video")
+    
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), total_frames
+
+def load_video_frame(video_hash: str, video_path: str, frame_number: int = 0):
     """Extract specific frame from video for annotation"""
+    # Reruns at the same frame (e.g. clicking points) reuse the last decode
+    key = (video_hash, frame_number)
+    last = st.session_state.get('_last_frame')
+    if last is not None and last[0] == key:
+        return last[1]
+    
     try:
-        cap = cv2.VideoCapture(video_path)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        if frame_number >= total_frames:
-            frame_number = 0
-        
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        ret, frame = cap.read()
-        cap.release()
-        
-        if not ret:
-            raise ValueError(f"Could not read frame {frame_number} from video")
-        
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), total_frames
-        
+        frame_data = _read_video_frame(_video_capture(video_path), frame_number)
     except Exception as e:
         st.error(f"Error loading video frame: {str(e)}")
         return None, 0
+    
+    st.session_state._last_frame = (key, frame_data)
+    return frame_data
 
 def save_ground_truth_points(output_path: str, video_name: str, frame_number: int):
     """Save point pairs in JSON format for later homography calculation"""
@@ -200,7 +263,7 @@ def save_ground_truth_points(output_path: str, video_name: str, frame_number: in
         "frame_number": frame_number,
         "image_points": st.session_state.selected_points,
         "world_points": st.session_state.real_world_coords,
-        "timestamp": str(pd.Timestamp.now()),
+        "timestamp": str(datetime.now()),
         "total_points": len(st.session_state.selected_points)
     }
     
@@ -153,6 +153,9 @@ def process_video_embedded(video_source, gt_path, model_path, confidence, device
     frame_count = 0
     total_frames = min(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), max_frames)
     
+    # RGB display buffers, allocated by the first conversion and reused for every frame
+    frame_rgb = map_rgb = None
+    
     try:
         while cap.isOpened() and frame_count < max_frames:
             ret, frame = cap.read()
@@ -167,38 +170,37 @@ def process_video_embedded(video_source, gt_path, model_path, confidence, device
             tracked_objects = tracker.update(detections)
             
             # Process detections with world coordinates
-            for det in tracked_objects:
-                if det['confidence'] >= confidence:
-                    # Convert xywh to xyxy format (YOLO format is center_x, center_y, width, height)
-                    x, y, w, h = det['bbox']
-                    x1, y1 = x - w/2, y - h/2
-                    x2, y2 = x + w/2, y + h/2
-                    center_x = x
-                    center_y = y2  # Use bottom of bbox for ground contact                    
-                    # Transform to world coordinates
-                    world_x, world_y = homography_calc.transform_point(center_x, center_y)
-                    
-                    # Update map
-                    map_canvas.update_object(
-                        det['track_id'], world_x, world_y,
-                        det['class_name'], det['confidence']
-                    )
-                    
-                    # Annotate frame with correct bbox format
-                    # x1, y1 already calculated above
-                    # x2, y2 already calculated above
-                    color = map_canvas.get_track_color(det['track_id'])
-                    
-                    cv2.rectangle(frame, (int(x1), int(y1)), (int(x2), int(y2)), color, 2)
-                    cv2.putText(frame, f"ID:{det['track_id']} {det['class_name']}", 
-                               (int(x1), int(y1)-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+            confident = [det for det in tracked_objects if det['confidence'] >= confidence]
+            if confident:
+                # Bottom center of each xywh box (YOLO center format) is the ground contact point
+                ground_points = [(det['bbox'][0], det['bbox'][1] + det['bbox'][3] / 2) for det in confident]
+                
+                # Transform to world coordinates and update the map for the whole frame at once
+                world = homography_calc.transform_points_batch(ground_points)
+                map_canvas.update_objects(
+                    [det['track_id'] for det in confident], world[:, 0], world[:, 1],
+                    [det['class_name'] for det in confident], [det['confidence'] for det in confident]
+                )
+            
+            for det in confident:
+                # Convert xywh to xyxy format (YOLO format is center_x, center_y, width, height)
+                x, y, w, h = det['bbox']
+                x1, y1 = x - w/2, y - h/2
+                x2, y2 = x + w/2, y + h/2
+                
+                # Annotate frame with correct bbox format
+                color = map_canvas.get_track_color(det['track_id'])
+                
+                cv2.rectangle(frame, (int(x1), int(y1)), (int(x2), int(y2)), color, 2)
+                cv2.putText(frame, f"ID:{det['track_id']} {det['class_name']}", 
+                           (int(x1), int(y1)-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
             
             # Render map
             map_image = map_canvas.render(show_trails=True, show_grid=True)
             
-            # Convert BGR to RGB for Streamlit
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            map_rgb = cv2.cvtColor(map_image, cv2.COLOR_BGR2RGB)
+            # Convert BGR to RGB for Streamlit (st.image encodes synchronously, so the buffers can be reused)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
+            map_rgb = cv2.cvtColor(map_image, cv2.COLOR_BGR2RGB, dst=map_rgb)
             
             # Update displays
             video_placeholder.image(frame_rgb, channels="RGB", use_column_width=True)